@@ -111,7 +111,7 @@ class CreatePaymentCampaignHandler:
             )
         
         # Calculate total amount
-        total_amount = Money(
+        total_amount = Money.from_amount(
             sum(inv.current_balance.amount for inv in invoices),
             invoices[0].current_balance.currency
         )
@@ -509,13 +509,13 @@ class CreatePaymentPlanHandler:
         
         # Get invoices
         invoices = []
-        total_amount = Money(0.0, "USD")
+        total_amount = Money.from_amount(0.0, "USD")
         
         for invoice_id in command.invoice_ids:
             invoice = self._invoice_repository.find_by_id(invoice_id)
             if invoice:
                 invoices.append(invoice)
-                total_amount = Money(
+                total_amount = Money.from_amount(
                     total_amount.amount + invoice.current_balance.amount,
                     invoice.current_balance.currency
                 )
@@ -525,7 +525,7 @@ class CreatePaymentPlanHandler:
                 success=False,
                 error_message="No valid invoices found",
                 payment_plan_id="",
-                monthly_payment=Money(0, "USD"),
+                monthly_payment=Money.from_amount(0, "USD"),
                 total_payments=0,
                 first_payment_due=datetime.utcnow(),
                 autopay_configured=False
@@ -554,7 +554,7 @@ class CreatePaymentPlanHandler:
                 success=False,
                 error_message=plan_result["error"],
                 payment_plan_id="",
-                monthly_payment=Money(0, "USD"),
+                monthly_payment=Money.from_amount(0, "USD"),
                 total_payments=0,
                 first_payment_due=datetime.utcnow(),
                 autopay_configured=False
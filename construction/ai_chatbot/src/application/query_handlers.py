@@ -112,7 +112,7 @@ class GetOverdueInvoicesHandler:
         return OverdueInvoicesResult(
             invoices=invoices_data,
             total_count=total_count,
-            total_amount=Money(total_amount, "USD"),
+            total_amount=Money.from_amount(total_amount, "USD"),
             average_days_overdue=average_days_overdue,
             priority_breakdown=priority_breakdown
         )
@@ -153,7 +153,7 @@ class GetPaymentCampaignsHandler:
             campaigns=campaigns_data,
             total_count=total_count,
             status_breakdown=status_breakdown,
-            total_amount_in_campaigns=Money(total_amount, "USD"),
+            total_amount_in_campaigns=Money.from_amount(total_amount, "USD"),
             success_rate=success_rate
         )
 
@@ -628,7 +628,7 @@ class PaymentProcessingService:
         # Create payment command
         payment_command = ProcessIncomingPaymentCommand(
             invoice_id=invoice_id,
-            payment_amount=Money(payment_details["amount"], payment_details["currency"]),
+            payment_amount=Money.from_amount(payment_details["amount"], payment_details["currency"]),
             payment_date=payment_details["payment_date"],
             payment_method=payment_details["method"],
             confirmation_number=payment_details["confirmation"],
@@ -697,7 +697,7 @@ class PaymentProcessingService:
             invoice_ids=invoice_ids,
             plan_type=selected_plan["plan_type"],
             installments=selected_plan["installments"],
-            monthly_payment=Money(selected_plan["monthly_payment"], "USD"),
+            monthly_payment=Money.from_amount(selected_plan["monthly_payment"], "USD"),
             start_date=selected_plan["start_date"],
             setup_autopay=selected_plan.get("setup_autopay", False),
             payment_method=selected_plan.get("payment_method"),
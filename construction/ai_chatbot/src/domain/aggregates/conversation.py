@@ -4,6 +4,7 @@ Conversation Aggregate Root for Payment Intelligence Domain
 Handles AI chatbot interactions with users, maintains conversation context,
 and coordinates with payment campaigns for payment-related actions.
 """
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Set
 from enum import Enum
@@ -295,20 +296,14 @@ class Conversation(Entity):
         self._active_invoice_ids.add(invoice_id)
         
         # Update context
-        new_related_invoices = list(self._current_context.related_invoice_ids)
+        new_related_invoices = self._current_context.related_invoice_ids
         if invoice_id not in new_related_invoices:
-            new_related_invoices.append(invoice_id)
+            new_related_invoices += (invoice_id,)
             
-        self._current_context = ConversationContext(
-            user_id=self._current_context.user_id,
-            session_id=self._current_context.session_id,
-            current_intent=self._current_context.current_intent,
+        self._current_context = replace(
+            self._current_context,
             related_invoice_ids=new_related_invoices,
-            customer_info=self._current_context.customer_info,
-            conversation_stage=self._current_context.conversation_stage,
-            last_action_timestamp=datetime.utcnow(),
-            sentiment_score=self._current_context.sentiment_score,
-            escalation_flags=self._current_context.escalation_flags
+            last_action_timestamp=datetime.utcnow()
         )
         
         self.mark_as_modified()
@@ -424,7 +419,7 @@ class Conversation(Entity):
             user_id=self._user_id,
             session_id=self._session_id,
             current_intent=None,
-            related_invoice_ids=[],
+            related_invoice_ids=(),
             customer_info={"email": self._contact_info.email},
             conversation_stage="greeting",
             last_action_timestamp=datetime.utcnow()
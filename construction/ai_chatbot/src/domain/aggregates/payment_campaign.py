@@ -89,6 +89,7 @@ class PaymentCampaign(Entity):
         self._reminders: List[PaymentReminder] = []
         self._current_reminder_level = ReminderLevel.FIRST
         self._last_reminder_date: Optional[datetime] = None
+        self._last_reminder: Optional[PaymentReminder] = None
         self._next_reminder_date: Optional[datetime] = None
         
         # Alternative payment options
@@ -141,6 +142,11 @@ class PaymentCampaign(Entity):
     def reminders(self) -> List[PaymentReminder]:
         return self._reminders.copy()
     
+    @property
+    def last_reminder(self) -> Optional[PaymentReminder]:
+        """Most recently sent reminder, tracked as reminders are sent"""
+        return self._last_reminder
+    
     @property
     def alternative_options(self) -> List[AlternativePaymentOption]:
         return self._alternative_options.copy()
@@ -196,6 +202,7 @@ class PaymentCampaign(Entity):
         reminder.mark_as_sent(sent_date)
         
         self._last_reminder_date = sent_date
+        self._last_reminder = reminder
         self._total_contact_attempts += 1
         
         # Update invoice reminder tracking
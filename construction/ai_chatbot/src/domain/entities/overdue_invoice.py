@@ -4,6 +4,7 @@ Overdue Invoice Entity for Payment Intelligence Domain
 Represents an invoice that requires payment collection with extended metadata.
 """
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -114,6 +115,11 @@ class OverdueInvoice(Entity):
     def due_date(self) -> datetime:
         return self._due_date
     
+    @cached_property
+    def due_date_formatted(self) -> str:
+        """Due date formatted for customer communications (computed once)"""
+        return self._due_date.strftime("%B %d, %Y")
+    
     @property
     def issue_date(self) -> datetime:
         return self._issue_date
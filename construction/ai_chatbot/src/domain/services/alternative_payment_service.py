@@ -95,11 +95,11 @@ class AlternativePaymentService:
         
         # Business configuration
         self._max_installments = 12
-        self._min_installment_amount = Money(100.0, "USD")
+        self._min_installment_amount = Money.from_amount(100.0, "USD")
         self._max_settlement_discount = Decimal("0.15")  # 15%
         self._early_payment_discount = Decimal("0.02")   # 2%
         self._hardship_discount_limit = Decimal("0.25")  # 25%
-        self._payment_plan_setup_fee = Money(25.0, "USD")
+        self._payment_plan_setup_fee = Money.from_amount(25.0, "USD")
     
     def generate_payment_options(
         self,
@@ -197,7 +197,7 @@ class AlternativePaymentService:
             "payment_schedule": payment_schedule,
             "total_cost": total_cost,
             "monthly_payment": payment_schedule[0]["amount"] if payment_schedule else None,
-            "setup_fee": plan_details.get("setup_fee", Money(0, "USD")),
+            "setup_fee": plan_details.get("setup_fee", Money.from_amount(0, "USD")),
             "interest_rate": plan_details.get("interest_rate", 0.0),
             "recurring_payment_id": recurring_payment_id,
             "created_at": datetime.utcnow(),
@@ -235,9 +235,9 @@ class AlternativePaymentService:
         payment_deadline = datetime.utcnow() + timedelta(days=14)  # 14 days to accept
         
         return {
-            "original_amount": Money(original_amount, invoice.current_balance.currency),
-            "settlement_amount": Money(settlement_amount, invoice.current_balance.currency),
-            "discount_amount": Money(savings, invoice.current_balance.currency),
+            "original_amount": Money.from_amount(original_amount, invoice.current_balance.currency),
+            "settlement_amount": Money.from_amount(settlement_amount, invoice.current_balance.currency),
+            "discount_amount": Money.from_amount(savings, invoice.current_balance.currency),
             "discount_percentage": total_discount * 100,
             "payment_deadline": payment_deadline,
             "terms": {
@@ -280,7 +280,7 @@ class AlternativePaymentService:
                     "advantages": suitability["advantages"],
                     "considerations": suitability["considerations"],
                     "processing_fee": processing_fee,
-                    "total_cost": Money(
+                    "total_cost": Money.from_amount(
                         payment_amount.amount + processing_fee.amount,
                         payment_amount.currency
                     ),
@@ -323,7 +323,7 @@ class AlternativePaymentService:
         # Generate strategy recommendation
         strategy = {
             "recommended_option": optimal_option["option"],
-            "expected_collection_amount": Money(optimal_option["expected_collection"], invoice.current_balance.currency),
+            "expected_collection_amount": Money.from_amount(optimal_option["expected_collection"], invoice.current_balance.currency),
             "success_probability": optimal_option["success_probability"],
             "estimated_collection_time_days": optimal_option["time_to_collection"],
             "customer_satisfaction_impact": optimal_option["customer_satisfaction_impact"],
@@ -367,14 +367,14 @@ class AlternativePaymentService:
             total_with_interest = total_amount * (1 + interest_rate)
             monthly_with_interest = total_with_interest / months
             
-            setup_fee = self._payment_plan_setup_fee if months > 6 else Money(0, "USD")
+            setup_fee = self._payment_plan_setup_fee if months > 6 else Money.from_amount(0, "USD")
             
             option = AlternativePaymentOption(
                 option_id=f"installment_{months}m",
                 option_type="installment_plan",
                 description=f"{months}-month installment plan",
-                payment_amount=Money(monthly_with_interest, invoice.current_balance.currency),
-                total_amount=Money(total_with_interest + setup_fee.amount, invoice.current_balance.currency),
+                payment_amount=Money.from_amount(monthly_with_interest, invoice.current_balance.currency),
+                total_amount=Money.from_amount(total_with_interest + setup_fee.amount, invoice.current_balance.currency),
                 due_date=datetime.utcnow() + timedelta(days=30),
                 terms={
                     "installments": months,
@@ -416,8 +416,8 @@ class AlternativePaymentService:
                 option_id=f"settlement_{days}d_{int(discount_rate*100)}pct",
                 option_type="settlement_discount",
                 description=f"{int(discount_rate*100)}% settlement discount for {days}-day payment",
-                payment_amount=Money(discounted_amount, invoice.current_balance.currency),
-                total_amount=Money(discounted_amount, invoice.current_balance.currency),
+                payment_amount=Money.from_amount(discounted_amount, invoice.current_balance.currency),
+                total_amount=Money.from_amount(discounted_amount, invoice.current_balance.currency),
                 due_date=datetime.utcnow() + timedelta(days=days),
                 terms={
                     "discount_rate": discount_rate,
@@ -448,8 +448,8 @@ class AlternativePaymentService:
             option_id="early_payment_discount",
             option_type="early_payment_incentive",
             description=f"Pay within 3 days and save {self._early_payment_discount*100}%",
-            payment_amount=Money(discounted_total, invoice.current_balance.currency),
-            total_amount=Money(discounted_total, invoice.current_balance.currency),
+            payment_amount=Money.from_amount(discounted_total, invoice.current_balance.currency),
+            total_amount=Money.from_amount(discounted_total, invoice.current_balance.currency),
             due_date=datetime.utcnow() + timedelta(days=3),
             terms={
                 "discount_rate": self._early_payment_discount,
@@ -527,8 +527,8 @@ class AlternativePaymentService:
             option_id="hardship_assistance",
             option_type="hardship_plan",
             description=f"Hardship assistance with {int(hardship_discount*100)}% reduction",
-            payment_amount=Money(reduced_amount / 6, invoice.current_balance.currency),  # 6-month plan
-            total_amount=Money(reduced_amount, invoice.current_balance.currency),
+            payment_amount=Money.from_amount(reduced_amount / 6, invoice.current_balance.currency),  # 6-month plan
+            total_amount=Money.from_amount(reduced_amount, invoice.current_balance.currency),
             due_date=datetime.utcnow() + timedelta(days=30),
             terms={
                 "hardship_discount": hardship_discount,
@@ -614,7 +614,7 @@ class AlternativePaymentService:
             
             schedule.append({
                 "installment_number": month + 1,
-                "amount": Money(monthly_payment, total_amount.currency),
+                "amount": Money.from_amount(monthly_payment, total_amount.currency),
                 "due_date": due_date,
                 "status": "pending"
             })
@@ -634,11 +634,11 @@ class AlternativePaymentService:
         interest_amount = base_amount * interest_rate
         
         # Add setup fee
-        setup_fee = plan_details.get("setup_fee", Money(0, original_amount.currency)).amount
+        setup_fee = plan_details.get("setup_fee", Money.from_amount(0, original_amount.currency)).amount
         
         total_cost = base_amount + interest_amount + setup_fee
         
-        return Money(total_cost, original_amount.currency)
+        return Money.from_amount(total_cost, original_amount.currency)
     
     def _calculate_installment_interest_rate(
         self,
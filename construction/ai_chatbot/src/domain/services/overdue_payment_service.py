@@ -4,14 +4,58 @@ Overdue Payment Service for Payment Intelligence Domain
 Domain service responsible for identifying, prioritizing, and managing
 overdue invoices for payment collection campaigns.
 """
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 from abc import ABC, abstractmethod
 
 from ..entities.overdue_invoice import OverdueInvoice, PaymentPriority
 from ..value_objects.payment_value_objects import PaymentStatus, Money, ReminderLevel
 
 
+# Urgency score lower bounds -> urgency level
+_URGENCY_THRESHOLDS = (40, 60, 80)
+_URGENCY_LEVELS = ("low", "medium", "high", "critical")
+
+# Stage recommendations are constant; shared rather than rebuilt per call
+_EARLY_STAGE_RECOMMENDATIONS = (
+    "send_friendly_reminder",
+    "check_payment_processing_delays",
+    "verify_contact_information",
+    "offer_automatic_payment_setup"
+)
+_MIDDLE_STAGE_RECOMMENDATIONS = (
+    "send_second_reminder",
+    "include_payment_options",
+    "offer_payment_plan",
+    "request_payment_commitment_date"
+)
+_LATE_STAGE_RECOMMENDATIONS = (
+    "send_urgent_reminder",
+    "request_immediate_payment",
+    "offer_settlement_discount",
+    "schedule_payment_plan_call",
+    "document_collection_efforts"
+)
+_CRITICAL_STAGE_RECOMMENDATIONS = (
+    "prepare_escalation_documentation",
+    "final_demand_notice",
+    "legal_review_recommended",
+    "consider_collection_agency",
+    "account_hold_procedures"
+)
+
+# Days overdue upper bounds -> collection stage (1-7, 8-14, 15-30, 30+)
+_STAGE_THRESHOLDS = (7, 14, 30)
+_STAGE_RECOMMENDATIONS = (
+    _EARLY_STAGE_RECOMMENDATIONS,
+    _MIDDLE_STAGE_RECOMMENDATIONS,
+    _LATE_STAGE_RECOMMENDATIONS,
+    _CRITICAL_STAGE_RECOMMENDATIONS
+)
+
+
 class IInvoiceRepository(ABC):
     """Interface for invoice repository"""
     
@@ -22,6 +66,10 @@ class IInvoiceRepository(ABC):
     @abstractmethod
     def find_by_id(self, invoice_id: str) -> Optional[OverdueInvoice]:
         pass
+    
+    def iter_overdue_invoices(self, customer_id: Optional[str] = None) -> Iterator[OverdueInvoice]:
+        """Stream overdue invoices; override to page through the backing store"""
+        yield from self.find_overdue_invoices(customer_id)
 
 
 class ICustomerRepository(ABC):
@@ -34,6 +82,14 @@ class ICustomerRepository(ABC):
     @abstractmethod
     def get_customer_risk_profile(self, customer_id: str) -> Dict[str, Any]:
         pass
+    
+    def get_customer_payment_histories(self, customer_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch payment history lookup; override to fetch in a single round-trip"""
+        return {customer_id: self.get_customer_payment_history(customer_id) for customer_id in customer_ids}
+    
+    def get_customer_risk_profiles(self, customer_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch risk profile lookup; override to fetch in a single round-trip"""
+        return {customer_id: self.get_customer_risk_profile(customer_id) for customer_id in customer_ids}
 
 
 class OverduePaymentService:
@@ -49,62 +105,58 @@ class OverduePaymentService:
         self._customer_repository = customer_repository
         
         # Business rules configuration
-        self._high_priority_threshold = Money(5000.0, "USD")
+        self._high_priority_threshold = Money.from_amount(5000.0, "USD")
         self._critical_days_overdue = 30
         self._risk_score_threshold = 0.7
-        self._vip_customer_threshold = Money(100000.0, "USD")  # Annual volume
+        self._vip_customer_threshold = Money.from_amount(100000.0, "USD")  # Annual volume
+        
+        # Raw threshold amounts for per-invoice comparisons
+        self._high_priority_amount = self._high_priority_threshold.amount
+        self._vip_customer_amount = self._vip_customer_threshold.amount
     
     def identify_overdue_invoices(self, customer_id: Optional[str] = None) -> List[OverdueInvoice]:
         """Identify all overdue invoices, optionally filtered by customer"""
-        all_overdue = self._invoice_repository.find_overdue_invoices(customer_id)
-        
-        # Filter to only actionable overdue invoices
-        actionable_invoices = [
-            invoice for invoice in all_overdue
-            if invoice.payment_status.is_actionable() and invoice.payment_status.is_collectible()
-        ]
-        
-        return actionable_invoices
+        return list(self.iter_overdue_invoices(customer_id))
+    
+    def iter_overdue_invoices(self, customer_id: Optional[str] = None) -> Iterator[OverdueInvoice]:
+        """Stream actionable overdue invoices without materializing the full overdue set"""
+        for invoice in self._invoice_repository.iter_overdue_invoices(customer_id):
+            # Filter to only actionable overdue invoices
+            if invoice.payment_status.is_actionable_and_collectible():
+                yield invoice
     
-    def prioritize_overdue_invoices(self, invoices: List[OverdueInvoice]) -> List[OverdueInvoice]:
+    def prioritize_overdue_invoices(self, invoices: Iterable[OverdueInvoice]) -> List[OverdueInvoice]:
         """Prioritize overdue invoices based on business rules"""
-        prioritized_invoices = []
-        
-        for invoice in invoices:
-            # Calculate priority score
-            priority_score = self._calculate_priority_score(invoice)
-            
-            # Store priority score in invoice for sorting
-            invoice._priority_score = priority_score
-            prioritized_invoices.append(invoice)
+        # Accepts a stream from iter_overdue_invoices; ranking needs the full set
+        invoices = list(invoices)
+        
+        # Fetch customer data once per customer rather than once per invoice
+        customer_ids = {invoice.customer_id for invoice in invoices}
+        histories = self._customer_repository.get_customer_payment_histories(customer_ids)
+        risk_profiles = self._customer_repository.get_customer_risk_profiles(customer_ids)
+        
+        # Pair each invoice with its score instead of storing it on the entity
+        scored_invoices = [
+            (self._calculate_priority_score(invoice, histories, risk_profiles), invoice)
+            for invoice in invoices
+        ]
         
-        # Sort by priority score (highest first)
-        prioritized_invoices.sort(key=lambda inv: inv._priority_score, reverse=True)
+        # Sort by priority score (highest first); the stable sort keeps input order on ties
+        scored_invoices.sort(key=itemgetter(0), reverse=True)
         
-        return prioritized_invoices
+        return [invoice for _, invoice in scored_invoices]
     
     def get_collection_recommendations(self, invoice: OverdueInvoice) -> List[str]:
         """Get AI-powered collection recommendations for an invoice"""
-        recommendations = []
-        
         # Get customer history
         customer_history = self._customer_repository.get_customer_payment_history(invoice.customer_id)
         customer_risk = self._customer_repository.get_customer_risk_profile(invoice.customer_id)
         
         # Days overdue analysis
-        days_overdue = invoice.days_overdue
-        
-        if days_overdue <= 7:
-            recommendations.extend(self._get_early_stage_recommendations(invoice, customer_history))
-        elif days_overdue <= 14:
-            recommendations.extend(self._get_middle_stage_recommendations(invoice, customer_history))
-        elif days_overdue <= 30:
-            recommendations.extend(self._get_late_stage_recommendations(invoice, customer_history))
-        else:
-            recommendations.extend(self._get_critical_stage_recommendations(invoice, customer_history))
+        recommendations = list(_STAGE_RECOMMENDATIONS[bisect_left(_STAGE_THRESHOLDS, invoice.days_overdue)])
         
         # Amount-based recommendations
-        if invoice.current_balance.amount >= self._high_priority_threshold.amount:
+        if invoice.current_balance.amount >= self._high_priority_amount:
             recommendations.append("high_value_escalation")
             recommendations.append("manager_review_required")
         
@@ -125,39 +177,22 @@ class OverduePaymentService:
         if payment_patterns.get("prefers_payment_plans", False):
             recommendations.append("offer_payment_plan_early")
         
-        # Remove duplicates and return
-        return list(set(recommendations))
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(recommendations))
     
     def calculate_collection_urgency(self, invoice: OverdueInvoice) -> Tuple[str, float]:
         """Calculate urgency level and score for collection efforts"""
-        urgency_score = 0.0
-        
-        # Days overdue factor (0-40 points)
-        days_factor = min(invoice.days_overdue / 30.0, 1.0) * 40
-        urgency_score += days_factor
-        
-        # Amount factor (0-30 points)
-        amount_factor = min(invoice.current_balance.amount / 10000.0, 1.0) * 30
-        urgency_score += amount_factor
-        
-        # Customer risk factor (0-20 points)
         customer_risk = self._customer_repository.get_customer_risk_profile(invoice.customer_id)
-        risk_factor = customer_risk.get("risk_score", 0.0) * 20
-        urgency_score += risk_factor
         
-        # Reminder attempts factor (0-10 points)
-        reminder_factor = min(invoice.reminder_count / 3.0, 1.0) * 10
-        urgency_score += reminder_factor
+        urgency_score = (
+            min(invoice.days_overdue / 30.0, 1.0) * 40                    # Days overdue factor (0-40 points)
+            + min(invoice.current_balance.amount / 10000.0, 1.0) * 30     # Amount factor (0-30 points)
+            + customer_risk.get("risk_score", 0.0) * 20                   # Customer risk factor (0-20 points)
+            + min(invoice.reminder_count / 3.0, 1.0) * 10                 # Reminder attempts factor (0-10 points)
+        )
         
         # Determine urgency level
-        if urgency_score >= 80:
-            urgency_level = "critical"
-        elif urgency_score >= 60:
-            urgency_level = "high"
-        elif urgency_score >= 40:
-            urgency_level = "medium"
-        else:
-            urgency_level = "low"
+        urgency_level = _URGENCY_LEVELS[bisect_right(_URGENCY_THRESHOLDS, urgency_score)]
         
         return urgency_level, urgency_score
     
@@ -167,6 +202,12 @@ class OverduePaymentService:
         if invoice.requires_escalation():
             return True
         
+        # Check if amount is significant and overdue for too long
+        # (local check, evaluated before any repository lookups)
+        if (invoice.current_balance.amount >= 5000 and 
+            invoice.days_overdue >= 21):
+            return True
+        
         # Check if customer is high risk
         customer_risk = self._customer_repository.get_customer_risk_profile(invoice.customer_id)
         if customer_risk.get("risk_score", 0.0) > 0.8:
@@ -177,11 +218,6 @@ class OverduePaymentService:
         if len(customer_overdue) >= 3:
             return True
         
-        # Check if amount is significant and overdue for too long
-        if (invoice.current_balance.amount >= 5000 and 
-            invoice.days_overdue >= 21):
-            return True
-        
         return False
     
     def get_next_reminder_level(self, invoice: OverdueInvoice) -> Optional[ReminderLevel]:
@@ -197,9 +233,9 @@ class OverduePaymentService:
         
         # Business rule: VIP customers get extra reminder before escalation
         customer_history = self._customer_repository.get_customer_payment_history(invoice.customer_id)
-        annual_volume = customer_history.get("annual_volume", Money(0.0, "USD"))
+        annual_volume = customer_history.get("annual_volume", Money.from_amount(0.0, "USD"))
         
-        if (annual_volume.amount >= self._vip_customer_threshold.amount and
+        if (annual_volume.amount >= self._vip_customer_amount and
             current_level == ReminderLevel.THIRD):
             # Give VIP customer additional time before escalation
             return None  # Don't escalate immediately
@@ -208,90 +244,86 @@ class OverduePaymentService:
     
     def estimate_collection_probability(self, invoice: OverdueInvoice) -> float:
         """Estimate probability of successful collection (0.0 to 1.0)"""
-        base_probability = 0.8  # Start with 80% base probability
-        
-        # Adjust based on days overdue
-        days_penalty = min(invoice.days_overdue * 0.01, 0.3)  # Max 30% penalty
-        base_probability -= days_penalty
-        
-        # Adjust based on customer payment history
         customer_history = self._customer_repository.get_customer_payment_history(invoice.customer_id)
-        payment_rate = customer_history.get("on_time_payment_rate", 0.7)
-        base_probability = (base_probability + payment_rate) / 2
-        
-        # Adjust based on reminder responses
-        if invoice.reminder_count > 0:
-            # If reminders haven't been effective, reduce probability
-            response_rate = customer_history.get("reminder_response_rate", 0.5)
-            base_probability *= (0.8 + response_rate * 0.2)
-        
-        # Adjust based on amount (larger amounts may be harder to collect)
-        if invoice.current_balance.amount > 10000:
-            base_probability *= 0.9
-        elif invoice.current_balance.amount > 50000:
-            base_probability *= 0.8
-        
-        # Ensure probability is within valid range
-        return max(0.0, min(1.0, base_probability))
+        return self._collection_probability(
+            invoice.current_balance.amount, invoice.days_overdue, invoice.reminder_count, customer_history
+        )
     
-    def _calculate_priority_score(self, invoice: OverdueInvoice) -> float:
-        """Calculate priority score for invoice ranking"""
+    def _calculate_priority_score(
+        self,
+        invoice: OverdueInvoice,
+        histories: Dict[str, Dict[str, Any]],
+        risk_profiles: Dict[str, Dict[str, Any]]
+    ) -> float:
+        """Calculate priority score for invoice ranking from prefetched customer data"""
+        # Read each invoice value once; days_overdue is recomputed on every access
+        return self._priority_score(
+            invoice.current_balance.amount,
+            invoice.days_overdue,
+            invoice.reminder_count,
+            risk_profiles[invoice.customer_id],
+            histories[invoice.customer_id]
+        )
+    
+    def _priority_score(
+        self,
+        amount: float,
+        days_overdue: int,
+        reminder_count: int,
+        customer_risk: Dict[str, Any],
+        customer_history: Dict[str, Any]
+    ) -> float:
+        """Priority score from invoice values that have already been read"""
         score = 0.0
         
         # Amount weight (40% of score)
-        amount_score = min(invoice.current_balance.amount / 10000.0, 1.0) * 40
+        amount_score = min(amount / 10000.0, 1.0) * 40
         score += amount_score
         
         # Days overdue weight (30% of score)
-        days_score = min(invoice.days_overdue / 30.0, 1.0) * 30
+        days_score = min(days_overdue / 30.0, 1.0) * 30
         score += days_score
         
         # Customer risk weight (20% of score)
-        customer_risk = self._customer_repository.get_customer_risk_profile(invoice.customer_id)
         risk_score = customer_risk.get("risk_score", 0.0) * 20
         score += risk_score
         
         # Collection probability weight (10% of score)
-        collection_prob = self.estimate_collection_probability(invoice)
+        collection_prob = self._collection_probability(amount, days_overdue, reminder_count, customer_history)
         prob_score = collection_prob * 10
         score += prob_score
         
         return score
     
-    def _get_early_stage_recommendations(self, invoice: OverdueInvoice, customer_history: Dict) -> List[str]:
-        """Get recommendations for early stage collection (1-7 days overdue)"""
-        return [
-            "send_friendly_reminder",
-            "check_payment_processing_delays",
-            "verify_contact_information",
-            "offer_automatic_payment_setup"
-        ]
-    
-    def _get_middle_stage_recommendations(self, invoice: OverdueInvoice, customer_history: Dict) -> List[str]:
-        """Get recommendations for middle stage collection (8-14 days overdue)"""
-        return [
-            "send_second_reminder",
-            "include_payment_options",
-            "offer_payment_plan",
-            "request_payment_commitment_date"
-        ]
-    
-    def _get_late_stage_recommendations(self, invoice: OverdueInvoice, customer_history: Dict) -> List[str]:
-        """Get recommendations for late stage collection (15-30 days overdue)"""
-        return [
-            "send_urgent_reminder",
-            "request_immediate_payment",
-            "offer_settlement_discount",
-            "schedule_payment_plan_call",
-            "document_collection_efforts"
-        ]
-    
-    def _get_critical_stage_recommendations(self, invoice: OverdueInvoice, customer_history: Dict) -> List[str]:
-        """Get recommendations for critical stage collection (30+ days overdue)"""
-        return [
-            "prepare_escalation_documentation",
-            "final_demand_notice",
-            "legal_review_recommended",
-            "consider_collection_agency",
-            "account_hold_procedures"
-        ]
\ No newline at end of file
+    def _collection_probability(
+        self,
+        amount: float,
+        days_overdue: int,
+        reminder_count: int,
+        customer_history: Dict[str, Any]
+    ) -> float:
+        """Collection probability from invoice values that have already been read"""
+        base_probability = 0.8  # Start with 80% base probability
+        
+        # Adjust based on days overdue
+        days_penalty = min(days_overdue * 0.01, 0.3)  # Max 30% penalty
+        base_probability -= days_penalty
+        
+        # Adjust based on customer payment history
+        payment_rate = customer_history.get("on_time_payment_rate", 0.7)
+        base_probability = (base_probability + payment_rate) / 2
+        
+        # Adjust based on reminder responses
+        if reminder_count > 0:
+            # If reminders haven't been effective, reduce probability
+            response_rate = customer_history.get("reminder_response_rate", 0.5)
+            base_probability *= (0.8 + response_rate * 0.2)
+        
+        # Adjust based on amount (larger amounts may be harder to collect)
+        if amount > 10000:
+            base_probability *= 0.9
+        elif amount > 50000:
+            base_probability *= 0.8
+        
+        # Ensure probability is within valid range
+        return max(0.0, min(1.0, base_probability))
@@ -4,8 +4,11 @@ Reminder Escalation Service for Payment Intelligence Domain
 Domain service responsible for managing the escalation process for
 payment reminders and campaigns.
 """
+import asyncio
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
 from enum import Enum
 from abc import ABC, abstractmethod
 
@@ -32,6 +35,44 @@ class EscalationReason(Enum):
     COLLECTION_PROBABILITY_LOW = "collection_probability_low"
 
 
+# Escalation checks ordered by cost: attribute checks, then list scans, then
+# the repository lookup. Used when only the escalate/don't-escalate answer matters.
+_CHECKS_BY_COST = (
+    EscalationReason.REMINDER_LIMIT_REACHED,
+    EscalationReason.LARGE_AMOUNT_OVERDUE,
+    EscalationReason.COLLECTION_PROBABILITY_LOW,
+    EscalationReason.PAYMENT_DISPUTES,
+    EscalationReason.CUSTOMER_NON_RESPONSIVE,
+    EscalationReason.HIGH_RISK_CUSTOMER,
+    EscalationReason.MULTIPLE_INVOICES_OVERDUE
+)
+
+# Case-insensitive dispute marker in collection notes, matched without lowercasing each note
+_DISPUTE_PATTERN = re.compile("dispute", re.IGNORECASE)
+
+# Targeted prevention recommendations for each risk factor
+_PREVENTION_RECOMMENDATIONS = {
+    EscalationReason.CUSTOMER_NON_RESPONSIVE: (
+        "Try alternative contact methods (phone, email, SMS)",
+        "Update contact information",
+        "Engage customer relationship manager"
+    ),
+    EscalationReason.HIGH_RISK_CUSTOMER: (
+        "Require payment guarantee or collateral",
+        "Implement stricter payment terms",
+        "Consider credit insurance"
+    ),
+    EscalationReason.LARGE_AMOUNT_OVERDUE: (
+        "Offer payment plan immediately",
+        "Provide early payment discount",
+        "Schedule payment negotiation call"
+    )
+}
+
+# Reasons that have targeted prevention recommendations
+_PREVENTION_REASONS = tuple(_PREVENTION_RECOMMENDATIONS)
+
+
 class EscalationAction(Enum):
     """Actions to take when escalating"""
     COLLECTIONS_HANDOFF = "collections_handoff"
@@ -43,6 +84,66 @@ class EscalationAction(Enum):
     ACCOUNT_SUSPENSION = "account_suspension"
 
 
+# Actions taken for each escalation reason, in the order they are applied
+_REASON_ACTIONS = {
+    EscalationReason.REMINDER_LIMIT_REACHED: (
+        EscalationAction.COLLECTIONS_HANDOFF,
+    ),
+    EscalationReason.CUSTOMER_NON_RESPONSIVE: (
+        EscalationAction.MANAGER_REVIEW,
+        EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION
+    ),
+    EscalationReason.HIGH_RISK_CUSTOMER: (
+        EscalationAction.CREDIT_HOLD,
+        EscalationAction.COLLECTIONS_HANDOFF
+    ),
+    EscalationReason.LARGE_AMOUNT_OVERDUE: (
+        EscalationAction.MANAGER_REVIEW,
+        EscalationAction.LEGAL_REVIEW
+    ),
+    EscalationReason.MULTIPLE_INVOICES_OVERDUE: (
+        EscalationAction.CREDIT_HOLD,
+        EscalationAction.PAYMENT_PLAN_NEGOTIATION
+    ),
+    EscalationReason.PAYMENT_DISPUTES: (
+        EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION,
+        EscalationAction.MANAGER_REVIEW
+    ),
+    EscalationReason.COLLECTION_PROBABILITY_LOW: (
+        EscalationAction.COLLECTIONS_HANDOFF,
+        EscalationAction.LEGAL_REVIEW
+    )
+}
+
+# Reasons and actions that always need a person to follow up
+_MANUAL_REASONS = frozenset({
+    EscalationReason.PAYMENT_DISPUTES,
+    EscalationReason.HIGH_RISK_CUSTOMER,
+    EscalationReason.LARGE_AMOUNT_OVERDUE
+})
+_MANUAL_ACTIONS = frozenset({
+    EscalationAction.LEGAL_REVIEW,
+    EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION,
+    EscalationAction.PAYMENT_PLAN_NEGOTIATION
+})
+
+
+def _collection_probability(days_active: int, reminder_count: int) -> float:
+    """Simplified collection probability from campaign age and reminders sent"""
+    base_prob = 0.8
+    days_penalty = min(days_active * 0.01, 0.3)
+    reminder_penalty = reminder_count * 0.1
+    
+    return base_prob - days_penalty - reminder_penalty
+
+
+@dataclass(frozen=True, slots=True)
+class _EvaluationContext:
+    """Clock reading and prefetched lookups shared by the checks of one evaluation"""
+    now: datetime
+    active_campaign_counts: Dict[str, int] = field(default_factory=dict)
+
+
 class IPaymentCampaignRepository(ABC):
     """Interface for payment campaign repository"""
     
@@ -53,6 +154,13 @@ class IPaymentCampaignRepository(ABC):
     @abstractmethod
     def find_escalated_campaigns(self) -> List[PaymentCampaign]:
         pass
+    
+    def find_active_campaign_counts_by_customers(self, customer_ids: Iterable[str]) -> Dict[str, int]:
+        """Batch active campaign counts; override to fetch in a single round-trip"""
+        return {
+            customer_id: len(self.find_active_campaigns_by_customer(customer_id))
+            for customer_id in customer_ids
+        }
 
 
 class ICollectionsService(ABC):
@@ -65,6 +173,18 @@ class ICollectionsService(ABC):
     @abstractmethod
     def transfer_campaign_data(self, campaign: PaymentCampaign, case_id: str) -> bool:
         pass
+    
+    async def create_collections_case_async(
+        self,
+        campaign: PaymentCampaign,
+        reason: EscalationReason
+    ) -> str:
+        """Create a collections case without blocking; override with a native async client"""
+        return await asyncio.to_thread(self.create_collections_case, campaign, reason)
+    
+    async def transfer_campaign_data_async(self, campaign: PaymentCampaign, case_id: str) -> bool:
+        """Transfer campaign data without blocking; override with a native async client"""
+        return await asyncio.to_thread(self.transfer_campaign_data, campaign, case_id)
 
 
 class ReminderEscalationService:
@@ -86,95 +206,101 @@ class ReminderEscalationService:
         # Business configuration
         self._max_reminder_attempts = 3
         self._escalation_amount_threshold = 5000.0
+        self._high_risk_amount_threshold = 10000.0
+        self._collections_handoff_amount_threshold = 5000.0
+        
+        # Amount thresholds in minor units, compared directly against Money.minor
+        self._escalation_amount_threshold_minor = round(self._escalation_amount_threshold * 100)
+        self._high_risk_amount_threshold_minor = round(self._high_risk_amount_threshold * 100)
+        self._collections_handoff_amount_threshold_minor = round(
+            self._collections_handoff_amount_threshold * 100
+        )
         self._non_responsive_days = 14
         self._high_risk_threshold = 0.75
         self._multiple_invoices_threshold = 3
+        
+        # Escalation checks in reporting order (the first reason drives the collections case)
+        self._escalation_checks: Dict[
+            EscalationReason, Callable[[PaymentCampaign, _EvaluationContext], bool]
+        ] = {
+            EscalationReason.REMINDER_LIMIT_REACHED: self._check_reminder_limit_reached,
+            EscalationReason.CUSTOMER_NON_RESPONSIVE: self._check_customer_non_responsive,
+            EscalationReason.HIGH_RISK_CUSTOMER: self._check_high_risk_customer,
+            EscalationReason.LARGE_AMOUNT_OVERDUE: self._check_large_amount_overdue,
+            EscalationReason.MULTIPLE_INVOICES_OVERDUE: self._check_multiple_invoices_overdue,
+            EscalationReason.COLLECTION_PROBABILITY_LOW: self._check_low_collection_probability,
+            EscalationReason.PAYMENT_DISPUTES: self._check_payment_disputes
+        }
     
-    def evaluate_campaign_for_escalation(self, campaign: PaymentCampaign) -> Tuple[bool, List[EscalationReason]]:
+    def evaluate_campaign_for_escalation(
+        self,
+        campaign: PaymentCampaign,
+        stop_on_first: bool = False
+    ) -> Tuple[bool, List[EscalationReason]]:
         """
         Evaluate if a payment campaign should be escalated and why.
         
+        Args:
+            stop_on_first: Return as soon as any check fires, running the cheapest
+                checks first; reasons then holds only that first reason
+        
         Returns:
             Tuple of (should_escalate: bool, reasons: List[EscalationReason])
         """
-        escalation_reasons = []
-        
-        # Check reminder limit
-        if self._check_reminder_limit_reached(campaign):
-            escalation_reasons.append(EscalationReason.REMINDER_LIMIT_REACHED)
-        
-        # Check customer responsiveness
-        if self._check_customer_non_responsive(campaign):
-            escalation_reasons.append(EscalationReason.CUSTOMER_NON_RESPONSIVE)
-        
-        # Check customer risk profile
-        if self._check_high_risk_customer(campaign):
-            escalation_reasons.append(EscalationReason.HIGH_RISK_CUSTOMER)
-        
-        # Check amount threshold
-        if self._check_large_amount_overdue(campaign):
-            escalation_reasons.append(EscalationReason.LARGE_AMOUNT_OVERDUE)
-        
-        # Check multiple invoices
-        if self._check_multiple_invoices_overdue(campaign):
-            escalation_reasons.append(EscalationReason.MULTIPLE_INVOICES_OVERDUE)
-        
-        # Check collection probability
-        if self._check_low_collection_probability(campaign):
-            escalation_reasons.append(EscalationReason.COLLECTION_PROBABILITY_LOW)
-        
-        # Check for payment disputes
-        if self._check_payment_disputes(campaign):
-            escalation_reasons.append(EscalationReason.PAYMENT_DISPUTES)
+        return self._evaluate(campaign, _EvaluationContext(datetime.utcnow()), stop_on_first)
+    
+    def _evaluate(
+        self,
+        campaign: PaymentCampaign,
+        context: _EvaluationContext,
+        stop_on_first: bool = False
+    ) -> Tuple[bool, List[EscalationReason]]:
+        """Run the escalation checks for one campaign against an evaluation context"""
+        if stop_on_first:
+            for reason in _CHECKS_BY_COST:
+                if self._escalation_checks[reason](campaign, context):
+                    return True, [reason]
+            return False, []
+        
+        escalation_reasons = [
+            reason for reason, check in self._escalation_checks.items()
+            if check(campaign, context)
+        ]
         
         should_escalate = len(escalation_reasons) > 0
         
         return should_escalate, escalation_reasons
     
+    def evaluate_campaigns(
+        self,
+        campaigns: List[PaymentCampaign]
+    ) -> List[Tuple[bool, List[EscalationReason]]]:
+        """
+        Evaluate many campaigns for escalation, in input order.
+        
+        Active campaign counts are fetched and the clock is read once for the
+        whole batch instead of once per campaign.
+        """
+        customer_ids = {campaign.customer_id for campaign in campaigns}
+        context = _EvaluationContext(
+            now=datetime.utcnow(),
+            active_campaign_counts=self._campaign_repository.find_active_campaign_counts_by_customers(
+                customer_ids
+            )
+        )
+        
+        return [self._evaluate(campaign, context) for campaign in campaigns]
+    
     def determine_escalation_actions(
         self,
         campaign: PaymentCampaign,
         reasons: List[EscalationReason]
     ) -> List[EscalationAction]:
         """Determine what actions to take based on escalation reasons"""
-        actions = []
-        
-        # Map reasons to actions
-        for reason in reasons:
-            if reason == EscalationReason.REMINDER_LIMIT_REACHED:
-                actions.append(EscalationAction.COLLECTIONS_HANDOFF)
-            
-            elif reason == EscalationReason.CUSTOMER_NON_RESPONSIVE:
-                actions.append(EscalationAction.MANAGER_REVIEW)
-                actions.append(EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION)
-            
-            elif reason == EscalationReason.HIGH_RISK_CUSTOMER:
-                actions.append(EscalationAction.CREDIT_HOLD)
-                actions.append(EscalationAction.COLLECTIONS_HANDOFF)
-            
-            elif reason == EscalationReason.LARGE_AMOUNT_OVERDUE:
-                actions.append(EscalationAction.MANAGER_REVIEW)
-                actions.append(EscalationAction.LEGAL_REVIEW)
-            
-            elif reason == EscalationReason.MULTIPLE_INVOICES_OVERDUE:
-                actions.append(EscalationAction.CREDIT_HOLD)
-                actions.append(EscalationAction.PAYMENT_PLAN_NEGOTIATION)
-            
-            elif reason == EscalationReason.PAYMENT_DISPUTES:
-                actions.append(EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION)
-                actions.append(EscalationAction.MANAGER_REVIEW)
-            
-            elif reason == EscalationReason.COLLECTION_PROBABILITY_LOW:
-                actions.append(EscalationAction.COLLECTIONS_HANDOFF)
-                actions.append(EscalationAction.LEGAL_REVIEW)
-        
-        # Remove duplicates while preserving order
-        unique_actions = []
-        for action in actions:
-            if action not in unique_actions:
-                unique_actions.append(action)
-        
-        return unique_actions
+        # Map reasons to actions, removing duplicates while preserving order
+        return list(dict.fromkeys(
+            action for reason in reasons for action in _REASON_ACTIONS.get(reason, ())
+        ))
     
     def execute_escalation(
         self,
@@ -183,195 +309,169 @@ class ReminderEscalationService:
         actions: List[EscalationAction]
     ) -> Dict[str, Any]:
         """Execute the escalation process for a campaign"""
-        escalation_results = {
-            "campaign_id": campaign.campaign_id,
-            "escalation_timestamp": datetime.utcnow(),
-            "reasons": [reason.value for reason in reasons],
-            "actions_taken": [],
-            "collections_case_id": None,
-            "requires_manual_intervention": False,
-            "next_review_date": None
-        }
+        # Single clock reading so every timestamp in the results agrees
+        now = datetime.utcnow()
         
         # Execute each escalation action
+        results = []
         for action in actions:
             try:
-                result = self._execute_escalation_action(campaign, action, reasons)
-                escalation_results["actions_taken"].append({
-                    "action": action.value,
-                    "status": "completed",
-                    "result": result
-                })
-                
-                # Store important results
-                if action == EscalationAction.COLLECTIONS_HANDOFF:
-                    escalation_results["collections_case_id"] = result.get("case_id")
-                
+                results.append(self._execute_escalation_action(campaign, action, reasons, now=now))
             except Exception as e:
-                escalation_results["actions_taken"].append({
-                    "action": action.value,
-                    "status": "failed",
-                    "error": str(e)
-                })
-        
-        # Determine if manual intervention is required
-        escalation_results["requires_manual_intervention"] = self._requires_manual_intervention(
-            campaign, reasons, actions
-        )
+                results.append(e)
         
-        # Set next review date
-        escalation_results["next_review_date"] = self._calculate_next_review_date(
-            campaign, actions
-        )
+        return self._record_escalation(campaign, reasons, actions, results, now)
+    
+    async def execute_escalation_async(
+        self,
+        campaign: PaymentCampaign,
+        reasons: List[EscalationReason],
+        actions: List[EscalationAction]
+    ) -> Dict[str, Any]:
+        """
+        Execute the escalation process for a campaign, running actions concurrently.
         
-        # Publish escalation event
-        escalation_event = CampaignEscalated(
-            campaign_id=campaign.campaign_id,
-            customer_id=campaign.customer_id,
-            escalation_reasons=reasons,
-            escalation_actions=actions,
-            escalation_timestamp=escalation_results["escalation_timestamp"],
-            collections_case_id=escalation_results["collections_case_id"],
-            requires_manual_intervention=escalation_results["requires_manual_intervention"]
+        Actions are independent of each other, so total latency is that of the
+        slowest action rather than the sum; steps within an action stay sequential.
+        """
+        now = datetime.utcnow()
+        
+        results = await asyncio.gather(
+            *(
+                self._execute_escalation_action_async(campaign, action, reasons, now=now)
+                for action in actions
+            ),
+            return_exceptions=True
         )
         
-        # Add event to campaign
-        campaign.add_domain_event(escalation_event)
-        
-        return escalation_results
+        return self._record_escalation(campaign, reasons, actions, results, now)
     
     def get_escalation_metrics(self, date_range: Tuple[datetime, datetime]) -> Dict[str, Any]:
         """Get escalation metrics for analysis"""
         start_date, end_date = date_range
         escalated_campaigns = self._campaign_repository.find_escalated_campaigns()
-        
-        # Filter by date range
-        filtered_campaigns = [
-            campaign for campaign in escalated_campaigns
-            if start_date <= campaign.created_at <= end_date
-        ]
-        
-        # Calculate metrics
-        total_escalations = len(filtered_campaigns)
+        threshold_minor = self._collections_handoff_amount_threshold_minor
         
         # Group by escalation reasons
         reason_counts = {}
         action_counts = {}
         
-        for campaign in filtered_campaigns:
-            # This would require storing escalation history in the campaign
-            # For now, we'll simulate based on campaign state
-            if campaign.status.value == "escalated":
-                reason_counts["reminder_limit_reached"] = reason_counts.get("reminder_limit_reached", 0) + 1
+        # Filter by date range and accumulate every metric in a single pass
+        total_escalations = 0
+        successful_escalations = 0
+        collections_handoffs = 0
+        total_days = 0
         
-        # Calculate success rates
-        successful_escalations = len([
-            c for c in filtered_campaigns
-            if c.status.value in ["completed", "resolved"]
-        ])
+        for campaign in escalated_campaigns:
+            if not start_date <= campaign.created_at <= end_date:
+                continue
+            
+            total_escalations += 1
+            total_days += campaign.days_active
+            status = campaign.status.value
+            
+            if status == "escalated":
+                # This would require storing escalation history in the campaign
+                # For now, we'll simulate based on campaign state
+                reason_counts["reminder_limit_reached"] = reason_counts.get("reminder_limit_reached", 0) + 1
+                
+                # Collections handoffs are estimated from campaign characteristics
+                if campaign.total_amount.minor > threshold_minor:
+                    collections_handoffs += 1
+            
+            elif status in ("completed", "resolved"):
+                successful_escalations += 1
         
-        success_rate = successful_escalations / total_escalations if total_escalations > 0 else 0.0
+        if total_escalations == 0:
+            success_rate = average_time_to_escalation = collections_handoff_rate = 0.0
+        else:
+            success_rate = successful_escalations / total_escalations
+            average_time_to_escalation = total_days / total_escalations
+            collections_handoff_rate = collections_handoffs / total_escalations
         
         return {
             "total_escalations": total_escalations,
             "escalation_reasons": reason_counts,
             "escalation_actions": action_counts,
             "success_rate": success_rate,
-            "average_time_to_escalation": self._calculate_average_escalation_time(filtered_campaigns),
-            "collections_handoff_rate": self._calculate_collections_handoff_rate(filtered_campaigns)
+            "average_time_to_escalation": average_time_to_escalation,
+            "collections_handoff_rate": collections_handoff_rate
         }
     
     def recommend_escalation_prevention(self, campaign: PaymentCampaign) -> List[str]:
         """Recommend actions to prevent escalation"""
-        recommendations = []
+        context = _EvaluationContext(datetime.utcnow())
         
-        # Analyze campaign risk factors
-        should_escalate, reasons = self.evaluate_campaign_for_escalation(campaign)
+        # Analyze the risk factors that have targeted recommendations
+        reasons = [
+            reason for reason in _PREVENTION_REASONS
+            if self._escalation_checks[reason](campaign, context)
+        ]
         
-        if not should_escalate:
+        # Any other reason only decides whether escalation is on the cards at all
+        if not reasons and not self._evaluate(campaign, context, stop_on_first=True)[0]:
             return ["No escalation prevention needed - campaign is on track"]
         
-        # Provide targeted recommendations based on risk factors
-        for reason in reasons:
-            if reason == EscalationReason.CUSTOMER_NON_RESPONSIVE:
-                recommendations.extend([
-                    "Try alternative contact methods (phone, email, SMS)",
-                    "Update contact information",
-                    "Engage customer relationship manager"
-                ])
-            
-            elif reason == EscalationReason.LARGE_AMOUNT_OVERDUE:
-                recommendations.extend([
-                    "Offer payment plan immediately",
-                    "Provide early payment discount",
-                    "Schedule payment negotiation call"
-                ])
-            
-            elif reason == EscalationReason.HIGH_RISK_CUSTOMER:
-                recommendations.extend([
-                    "Require payment guarantee or collateral",
-                    "Implement stricter payment terms",
-                    "Consider credit insurance"
-                ])
-        
-        return list(set(recommendations))  # Remove duplicates
+        # Provide targeted recommendations based on risk factors, removing duplicates in order
+        return list(dict.fromkeys(
+            recommendation
+            for reason in reasons
+            for recommendation in _PREVENTION_RECOMMENDATIONS[reason]
+        ))
     
     # Private helper methods
     
-    def _check_reminder_limit_reached(self, campaign: PaymentCampaign) -> bool:
+    def _check_reminder_limit_reached(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if reminder limit has been reached"""
         return campaign.reminder_count >= self._max_reminder_attempts
     
-    def _check_customer_non_responsive(self, campaign: PaymentCampaign) -> bool:
+    def _check_customer_non_responsive(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if customer has been non-responsive"""
-        if not campaign.reminders:
+        last_reminder = campaign.last_reminder
+        if last_reminder is None:
             return False
         
-        last_reminder = max(campaign.reminders, key=lambda r: r.sent_at)
-        days_since_last = (datetime.utcnow() - last_reminder.sent_at).days
+        days_since_last = (context.now - last_reminder.sent_at).days
         
         return days_since_last >= self._non_responsive_days and not last_reminder.was_opened
     
-    def _check_high_risk_customer(self, campaign: PaymentCampaign) -> bool:
+    def _check_high_risk_customer(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if customer is high risk"""
         # This would integrate with customer risk assessment
         # For now, simulate based on campaign characteristics
-        return (campaign.total_amount.amount > 10000 and 
+        return (campaign.total_amount.minor > self._high_risk_amount_threshold_minor and 
                 campaign.reminder_count > 1 and
                 len([r for r in campaign.reminders if r.was_opened]) == 0)
     
-    def _check_large_amount_overdue(self, campaign: PaymentCampaign) -> bool:
+    def _check_large_amount_overdue(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if large amount is overdue"""
-        return campaign.total_amount.amount >= self._escalation_amount_threshold
+        return campaign.total_amount.minor >= self._escalation_amount_threshold_minor
     
-    def _check_multiple_invoices_overdue(self, campaign: PaymentCampaign) -> bool:
+    def _check_multiple_invoices_overdue(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if multiple invoices are overdue for same customer"""
-        customer_campaigns = self._campaign_repository.find_active_campaigns_by_customer(
-            campaign.customer_id
-        )
-        return len(customer_campaigns) >= self._multiple_invoices_threshold
+        active_count = context.active_campaign_counts.get(campaign.customer_id)
+        if active_count is None:
+            active_count = len(self._campaign_repository.find_active_campaigns_by_customer(
+                campaign.customer_id
+            ))
+        return active_count >= self._multiple_invoices_threshold
     
-    def _check_low_collection_probability(self, campaign: PaymentCampaign) -> bool:
+    def _check_low_collection_probability(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if collection probability is low"""
-        # Simplified probability calculation
-        base_prob = 0.8
-        days_penalty = min(campaign.days_active * 0.01, 0.3)
-        reminder_penalty = campaign.reminder_count * 0.1
-        
-        probability = base_prob - days_penalty - reminder_penalty
-        
-        return probability < 0.4
+        return _collection_probability(campaign.days_active, campaign.reminder_count) < 0.4
     
-    def _check_payment_disputes(self, campaign: PaymentCampaign) -> bool:
+    def _check_payment_disputes(self, campaign: PaymentCampaign, context: _EvaluationContext) -> bool:
         """Check if there are payment disputes"""
         # This would check for dispute flags in the campaign
-        return any(note.content.lower().find("dispute") >= 0 for note in campaign.collection_notes)
+        return any(_DISPUTE_PATTERN.search(note.content) for note in campaign.collection_notes)
     
     def _execute_escalation_action(
         self,
         campaign: PaymentCampaign,
         action: EscalationAction,
-        reasons: List[EscalationReason]
+        reasons: List[EscalationReason],
+        *,
+        now: datetime
     ) -> Dict[str, Any]:
         """Execute a specific escalation action"""
         
@@ -386,26 +486,114 @@ class ReminderEscalationService:
             return {
                 "case_id": case_id,
                 "transfer_success": success,
-                "handoff_timestamp": datetime.utcnow()
+                "handoff_timestamp": now
             }
         
         elif action == EscalationAction.MANAGER_REVIEW:
             return {
                 "review_assigned": True,
                 "priority": "high" if EscalationReason.LARGE_AMOUNT_OVERDUE in reasons else "medium",
-                "review_deadline": datetime.utcnow() + timedelta(days=2)
+                "review_deadline": now + timedelta(days=2)
             }
         
         elif action == EscalationAction.CREDIT_HOLD:
             return {
                 "credit_hold_applied": True,
-                "hold_timestamp": datetime.utcnow(),
+                "hold_timestamp": now,
                 "hold_reason": "overdue_payments"
             }
         
         # Add other action implementations as needed
         return {"action_completed": True}
     
+    async def _execute_escalation_action_async(
+        self,
+        campaign: PaymentCampaign,
+        action: EscalationAction,
+        reasons: List[EscalationReason],
+        *,
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Execute a specific escalation action, awaiting the collections service"""
+        if action == EscalationAction.COLLECTIONS_HANDOFF:
+            # The transfer needs the case id, so the two calls stay in sequence
+            primary_reason = reasons[0] if reasons else EscalationReason.REMINDER_LIMIT_REACHED
+            case_id = await self._collections_service.create_collections_case_async(campaign, primary_reason)
+            success = await self._collections_service.transfer_campaign_data_async(campaign, case_id)
+            
+            return {
+                "case_id": case_id,
+                "transfer_success": success,
+                "handoff_timestamp": now
+            }
+        
+        # Remaining actions make no external calls
+        return self._execute_escalation_action(campaign, action, reasons, now=now)
+    
+    def _record_escalation(
+        self,
+        campaign: PaymentCampaign,
+        reasons: List[EscalationReason],
+        actions: List[EscalationAction],
+        results: List[Any],
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Build the escalation results from per-action outcomes and publish the event"""
+        escalation_results = {
+            "campaign_id": campaign.campaign_id,
+            "escalation_timestamp": now,
+            "reasons": [reason.value for reason in reasons],
+            "actions_taken": [],
+            "collections_case_id": None,
+            "requires_manual_intervention": False,
+            "next_review_date": None
+        }
+        
+        for action, result in zip(actions, results):
+            if isinstance(result, BaseException):
+                escalation_results["actions_taken"].append({
+                    "action": action.value,
+                    "status": "failed",
+                    "error": str(result)
+                })
+                continue
+            
+            escalation_results["actions_taken"].append({
+                "action": action.value,
+                "status": "completed",
+                "result": result
+            })
+            
+            # Store important results
+            if action == EscalationAction.COLLECTIONS_HANDOFF:
+                escalation_results["collections_case_id"] = result.get("case_id")
+        
+        # Determine if manual intervention is required
+        escalation_results["requires_manual_intervention"] = self._requires_manual_intervention(
+            campaign, reasons, actions
+        )
+        
+        # Set next review date
+        escalation_results["next_review_date"] = self._calculate_next_review_date(
+            campaign, actions, now
+        )
+        
+        # Publish escalation event
+        escalation_event = CampaignEscalated(
+            campaign_id=campaign.campaign_id,
+            customer_id=campaign.customer_id,
+            escalation_reasons=reasons,
+            escalation_actions=actions,
+            escalation_timestamp=now,
+            collections_case_id=escalation_results["collections_case_id"],
+            requires_manual_intervention=escalation_results["requires_manual_intervention"]
+        )
+        
+        # Add event to campaign
+        campaign.add_domain_event(escalation_event)
+        
+        return escalation_results
+    
     def _requires_manual_intervention(
         self,
         campaign: PaymentCampaign,
@@ -413,25 +601,13 @@ class ReminderEscalationService:
         actions: List[EscalationAction]
     ) -> bool:
         """Determine if manual intervention is required"""
-        manual_reasons = [
-            EscalationReason.PAYMENT_DISPUTES,
-            EscalationReason.HIGH_RISK_CUSTOMER,
-            EscalationReason.LARGE_AMOUNT_OVERDUE
-        ]
-        
-        manual_actions = [
-            EscalationAction.LEGAL_REVIEW,
-            EscalationAction.CUSTOMER_RELATIONSHIP_INTERVENTION,
-            EscalationAction.PAYMENT_PLAN_NEGOTIATION
-        ]
-        
-        return (any(reason in manual_reasons for reason in reasons) or
-                any(action in manual_actions for action in actions))
+        return not (_MANUAL_REASONS.isdisjoint(reasons) and _MANUAL_ACTIONS.isdisjoint(actions))
     
     def _calculate_next_review_date(
         self,
         campaign: PaymentCampaign,
-        actions: List[EscalationAction]
+        actions: List[EscalationAction],
+        now: datetime
     ) -> datetime:
         """Calculate when to next review the escalated campaign"""
         base_days = 7  # Default weekly review
@@ -443,26 +619,4 @@ class ReminderEscalationService:
         elif EscalationAction.MANAGER_REVIEW in actions:
             base_days = 3   # Manager reviews are urgent
         
-        return datetime.utcnow() + timedelta(days=base_days)
-    
-    def _calculate_average_escalation_time(self, campaigns: List[PaymentCampaign]) -> float:
-        """Calculate average time from campaign start to escalation"""
-        if not campaigns:
-            return 0.0
-        
-        total_days = sum(campaign.days_active for campaign in campaigns)
-        return total_days / len(campaigns)
-    
-    def _calculate_collections_handoff_rate(self, campaigns: List[PaymentCampaign]) -> float:
-        """Calculate percentage of escalations that go to collections"""
-        if not campaigns:
-            return 0.0
-        
-        # This would require tracking escalation actions in campaign history
-        # For now, estimate based on campaign characteristics
-        collections_handoffs = len([
-            c for c in campaigns
-            if c.status.value == "escalated" and c.total_amount.amount > 5000
-        ])
-        
-        return collections_handoffs / len(campaigns)
\ No newline at end of file
+        return now + timedelta(days=base_days)
\ No newline at end of file
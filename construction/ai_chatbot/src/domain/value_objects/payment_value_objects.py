@@ -4,9 +4,10 @@ Domain Value Objects for Payment Intelligence Bounded Context
 Value objects are immutable objects that represent descriptive aspects of the domain
 with no conceptual identity. They are compared by their attributes rather than identity.
 """
+import re
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 
@@ -22,20 +23,22 @@ class ReminderLevel(Enum):
     
     def next_level(self) -> Optional['ReminderLevel']:
         """Get the next escalation level"""
-        levels = [ReminderLevel.FIRST, ReminderLevel.SECOND, ReminderLevel.THIRD, ReminderLevel.ESCALATED]
-        try:
-            current_index = levels.index(self)
-            if current_index < len(levels) - 1:
-                return levels[current_index + 1]
-            return None
-        except ValueError:
-            return None
+        return _NEXT_REMINDER_LEVEL[self]
     
     def is_final_reminder(self) -> bool:
         """Check if this is the final automated reminder before escalation"""
         return self == ReminderLevel.THIRD
 
 
+# Each escalation level mapped to the one that follows it
+_NEXT_REMINDER_LEVEL = {
+    ReminderLevel.FIRST: ReminderLevel.SECOND,
+    ReminderLevel.SECOND: ReminderLevel.THIRD,
+    ReminderLevel.THIRD: ReminderLevel.ESCALATED,
+    ReminderLevel.ESCALATED: None
+}
+
+
 class PaymentStatus(Enum):
     """Enumeration for payment status tracking"""
     PENDING = "pending"
@@ -51,11 +54,23 @@ class PaymentStatus(Enum):
     
     def is_actionable(self) -> bool:
         """Check if this status requires payment collection action"""
-        return self in [PaymentStatus.OVERDUE, PaymentStatus.PARTIALLY_PAID]
+        return self in _ACTIONABLE_STATUSES
     
     def is_collectible(self) -> bool:
         """Check if payment can still be collected"""
-        return self not in [PaymentStatus.PAID, PaymentStatus.CANCELLED, PaymentStatus.IN_DEFAULT]
+        return self not in _UNCOLLECTIBLE_STATUSES
+    
+    def is_actionable_and_collectible(self) -> bool:
+        """Check if this status needs collection action and can still be collected"""
+        return self in _ACTIONABLE_COLLECTIBLE_STATUSES
+
+
+# Statuses that need collection action, and those that can no longer be collected
+_ACTIONABLE_STATUSES = frozenset({PaymentStatus.OVERDUE, PaymentStatus.PARTIALLY_PAID})
+_UNCOLLECTIBLE_STATUSES = frozenset({PaymentStatus.PAID, PaymentStatus.CANCELLED, PaymentStatus.IN_DEFAULT})
+
+# Derived from the two sets so the combined check cannot drift from them
+_ACTIONABLE_COLLECTIBLE_STATUSES = _ACTIONABLE_STATUSES - _UNCOLLECTIBLE_STATUSES
 
 
 class MessageIntent(Enum):
@@ -74,63 +89,82 @@ class MessageIntent(Enum):
     
     def requires_immediate_action(self) -> bool:
         """Check if this intent requires immediate action"""
-        return self in [
-            MessageIntent.ESCALATION_TRIGGER,
-            MessageIntent.COMPLAINT,
-            MessageIntent.PAYMENT_CONFIRMATION
-        ]
+        return self in _IMMEDIATE_ACTION_INTENTS
+
 
+# Intents that need an immediate response
+_IMMEDIATE_ACTION_INTENTS = frozenset({
+    MessageIntent.ESCALATION_TRIGGER,
+    MessageIntent.COMPLAINT,
+    MessageIntent.PAYMENT_CONFIRMATION
+})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Money:
-    """Value object representing monetary amounts"""
-    amount: float
+    """Value object representing monetary amounts, held exactly as integer minor units (cents)"""
+    minor: int
     currency: str = "USD"
     
     def __post_init__(self):
-        if self.amount < 0:
+        if not isinstance(self.minor, int):
+            raise TypeError("Money takes integer minor units; use Money.from_amount for decimal amounts")
+        if self.minor < 0:
             raise ValueError("Money amount cannot be negative")
         if not self.currency:
             raise ValueError("Currency code is required")
         if len(self.currency) != 3:
             raise ValueError("Currency code must be 3 characters")
     
+    @classmethod
+    def from_amount(cls, amount: float, currency: str = "USD") -> 'Money':
+        """Create money from a decimal amount, rounded to whole minor units (cents)"""
+        return cls(round(amount * 100), currency)
+    
+    @property
+    def amount(self) -> float:
+        """Decimal amount (minor units / 100)"""
+        return self.minor / 100
+    
+    def __hash__(self) -> int:
+        return hash((self.minor, self.currency))
+    
     def add(self, other: 'Money') -> 'Money':
         """Add two money amounts (must be same currency)"""
         if self.currency != other.currency:
             raise ValueError(f"Cannot add different currencies: {self.currency} and {other.currency}")
-        return Money(self.amount + other.amount, self.currency)
+        return Money(self.minor + other.minor, self.currency)
     
     def subtract(self, other: 'Money') -> 'Money':
         """Subtract two money amounts (must be same currency)"""
         if self.currency != other.currency:
             raise ValueError(f"Cannot subtract different currencies: {self.currency} and {other.currency}")
-        result_amount = self.amount - other.amount
-        if result_amount < 0:
+        result_minor = self.minor - other.minor
+        if result_minor < 0:
             raise ValueError("Subtraction would result in negative amount")
-        return Money(result_amount, self.currency)
+        return Money(result_minor, self.currency)
     
     def multiply(self, factor: float) -> 'Money':
         """Multiply money by a factor"""
         if factor < 0:
             raise ValueError("Factor cannot be negative")
-        return Money(self.amount * factor, self.currency)
+        return Money(round(self.minor * factor), self.currency)
     
     def is_zero(self) -> bool:
         """Check if amount is zero"""
-        return abs(self.amount) < 0.01  # Account for floating point precision
+        return self.minor == 0
     
     def __str__(self) -> str:
         return f"{self.currency} {self.amount:.2f}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationContext:
     """Value object representing the current state of a conversation"""
     user_id: str
     session_id: str
     current_intent: Optional[MessageIntent]
-    related_invoice_ids: List[str]
+    related_invoice_ids: Tuple[str, ...]
     customer_info: Optional[dict]
     conversation_stage: str
     last_action_timestamp: datetime
@@ -145,38 +179,21 @@ class ConversationContext:
         if not self.conversation_stage:
             raise ValueError("Conversation stage is required")
         
+        # Invoice ids are held as a tuple so derived contexts can share them
+        if not isinstance(self.related_invoice_ids, tuple):
+            object.__setattr__(self, 'related_invoice_ids', tuple(self.related_invoice_ids))
+        
         # Set default empty list if None
         if self.escalation_flags is None:
             object.__setattr__(self, 'escalation_flags', [])
     
     def with_intent(self, intent: MessageIntent) -> 'ConversationContext':
         """Create new context with updated intent"""
-        return ConversationContext(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            current_intent=intent,
-            related_invoice_ids=self.related_invoice_ids,
-            customer_info=self.customer_info,
-            conversation_stage=self.conversation_stage,
-            last_action_timestamp=datetime.now(),
-            sentiment_score=self.sentiment_score,
-            escalation_flags=self.escalation_flags
-        )
+        return replace(self, current_intent=intent, last_action_timestamp=datetime.now())
     
     def add_invoice(self, invoice_id: str) -> 'ConversationContext':
         """Create new context with additional invoice"""
-        new_invoice_ids = self.related_invoice_ids + [invoice_id]
-        return ConversationContext(
-            user_id=self.user_id,
-            session_id=self.session_id,
-            current_intent=self.current_intent,
-            related_invoice_ids=new_invoice_ids,
-            customer_info=self.customer_info,
-            conversation_stage=self.conversation_stage,
-            last_action_timestamp=self.last_action_timestamp,
-            sentiment_score=self.sentiment_score,
-            escalation_flags=self.escalation_flags
-        )
+        return replace(self, related_invoice_ids=self.related_invoice_ids + (invoice_id,))
     
     def requires_escalation(self) -> bool:
         """Check if conversation should be escalated"""
@@ -185,7 +202,7 @@ class ConversationContext:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmailTemplate:
     """Value object representing an AI-generated email template"""
     template_id: str
@@ -223,7 +240,16 @@ class EmailTemplate:
         return len(self.personalization_tokens) > 0
 
 
-@dataclass(frozen=True)
+# Single address with a dotted domain, compiled once rather than per instance
+_EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Preferred contact methods, and those that allow each channel
+_CONTACT_METHODS = frozenset({"email", "phone", "both"})
+_EMAIL_CONTACT_METHODS = frozenset({"email", "both"})
+_PHONE_CONTACT_METHODS = frozenset({"phone", "both"})
+
+
+@dataclass(frozen=True, slots=True)
 class ContactInformation:
     """Value object for customer contact information"""
     email: str
@@ -233,15 +259,15 @@ class ContactInformation:
     def __post_init__(self):
         if not self.email:
             raise ValueError("Email is required")
-        if "@" not in self.email:
+        if not _EMAIL_PATTERN.fullmatch(self.email):
             raise ValueError("Invalid email format")
-        if self.preferred_contact_method not in ["email", "phone", "both"]:
+        if self.preferred_contact_method not in _CONTACT_METHODS:
             raise ValueError("Invalid preferred contact method")
     
     def can_contact_via_email(self) -> bool:
         """Check if customer can be contacted via email"""
-        return self.preferred_contact_method in ["email", "both"]
+        return self.preferred_contact_method in _EMAIL_CONTACT_METHODS
     
     def can_contact_via_phone(self) -> bool:
         """Check if customer can be contacted via phone"""
-        return self.phone is not None and self.preferred_contact_method in ["phone", "both"]
\ No newline at end of file
+        return self.phone is not None and self.preferred_contact_method in _PHONE_CONTACT_METHODS
\ No newline at end of file
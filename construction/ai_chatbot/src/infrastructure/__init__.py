@@ -13,6 +13,10 @@ The infrastructure layer follows the Dependency Inversion Principle,
 implementing interfaces defined in higher layers.
 """
 
+import logging
+import threading
+from datetime import datetime
+
 from .repositories import (
     InMemoryCustomerRepository,
     InMemoryInvoiceRepository,
@@ -50,11 +54,13 @@ from .external_services import (
     get_email_adapter,
     get_notification_adapter,
     get_payment_adapter,
+    reset_service_adapters,
     ServiceConfiguration,
     service_config
 )
 
 from .config import (
+    Environment,
     ApplicationConfig,
     DatabaseConfig,
     BedrockConfig,
@@ -83,6 +89,20 @@ class InfrastructureContainer:
     a single point of access to all infrastructure dependencies.
     """
     
+    # Each dependency is held in its own slot and created on first access
+    __slots__ = (
+        '_config',
+        '_customer_repository',
+        '_invoice_repository',
+        '_campaign_repository',
+        '_conversation_repository',
+        '_email_generator',
+        '_email_adapter',
+        '_notification_adapter',
+        '_payment_adapter',
+        '_validation'
+    )
+    
     def __init__(self, config: ApplicationConfig = None):
         """
         Initialize infrastructure container.
@@ -91,82 +111,128 @@ class InfrastructureContainer:
             config: Application configuration (uses default if None)
         """
         self._config = config or get_config()
-        self._repositories = {}
-        self._services = {}
-        self._adapters = {}
+        self._customer_repository = None
+        self._invoice_repository = None
+        self._campaign_repository = None
+        self._conversation_repository = None
+        self._email_generator = None
+        self._email_adapter = None
+        self._notification_adapter = None
+        self._payment_adapter = None
+        self._validation = None
     
     # Repository access methods
     def get_customer_repository(self):
         """Get customer repository instance."""
-        if 'customer' not in self._repositories:
-            self._repositories['customer'] = get_customer_repository()
-        return self._repositories['customer']
+        customer_repository = self._customer_repository
+        if customer_repository is None:
+            customer_repository = self._customer_repository = get_customer_repository()
+        return customer_repository
     
     def get_invoice_repository(self):
         """Get invoice repository instance."""
-        if 'invoice' not in self._repositories:
-            self._repositories['invoice'] = get_invoice_repository()
-        return self._repositories['invoice']
+        invoice_repository = self._invoice_repository
+        if invoice_repository is None:
+            invoice_repository = self._invoice_repository = get_invoice_repository()
+        return invoice_repository
     
     def get_payment_campaign_repository(self):
         """Get payment campaign repository instance."""
-        if 'campaign' not in self._repositories:
-            self._repositories['campaign'] = get_payment_campaign_repository()
-        return self._repositories['campaign']
+        campaign_repository = self._campaign_repository
+        if campaign_repository is None:
+            campaign_repository = self._campaign_repository = get_payment_campaign_repository()
+        return campaign_repository
     
     def get_conversation_repository(self):
         """Get conversation repository instance."""
-        if 'conversation' not in self._repositories:
-            self._repositories['conversation'] = get_conversation_repository()
-        return self._repositories['conversation']
+        conversation_repository = self._conversation_repository
+        if conversation_repository is None:
+            conversation_repository = self._conversation_repository = get_conversation_repository()
+        return conversation_repository
     
     # Service access methods
     def get_email_generator(self):
         """Get AI email generator service."""
-        if 'email_generator' not in self._services:
-            self._services['email_generator'] = get_email_generator(
+        email_generator = self._email_generator
+        if email_generator is None:
+            email_generator = self._email_generator = get_email_generator(
                 use_mock=self._config.bedrock.use_mock
             )
-        return self._services['email_generator']
+        return email_generator
     
     # Adapter access methods
     def get_email_adapter(self):
         """Get email service adapter."""
-        if 'email' not in self._adapters:
-            if self._config.email.adapter_type == "smtp":
-                self._adapters['email'] = get_email_adapter(
+        email_adapter = self._email_adapter
+        if email_adapter is None:
+            email_config = self._config.email
+            if email_config.adapter_type == "smtp":
+                email_adapter = get_email_adapter(
                     adapter_type="smtp",
-                    smtp_server=self._config.email.smtp_server,
-                    smtp_port=self._config.email.smtp_port,
-                    username=self._config.email.username,
-                    password=self._config.email.password,
-                    use_tls=self._config.email.use_tls
+                    smtp_server=email_config.smtp_server,
+                    smtp_port=email_config.smtp_port,
+                    username=email_config.username,
+                    password=email_config.password,
+                    use_tls=email_config.use_tls
                 )
             else:
-                self._adapters['email'] = get_email_adapter(adapter_type="mock")
-        return self._adapters['email']
+                email_adapter = get_email_adapter(adapter_type="mock")
+            self._email_adapter = email_adapter
+        return email_adapter
     
     def get_notification_adapter(self):
         """Get notification service adapter."""
-        if 'notification' not in self._adapters:
-            self._adapters['notification'] = get_notification_adapter(
+        notification_adapter = self._notification_adapter
+        if notification_adapter is None:
+            notification_adapter = self._notification_adapter = get_notification_adapter(
                 adapter_type=self._config.notification.adapter_type
             )
-        return self._adapters['notification']
+        return notification_adapter
     
     def get_payment_adapter(self):
         """Get payment service adapter."""
-        if 'payment' not in self._adapters:
-            self._adapters['payment'] = get_payment_adapter(
+        payment_adapter = self._payment_adapter
+        if payment_adapter is None:
+            payment_adapter = self._payment_adapter = get_payment_adapter(
                 adapter_type=self._config.payment.adapter_type
             )
-        return self._adapters['payment']
+        return payment_adapter
+    
+    def prewarm(self) -> None:
+        """
+        Create services ahead of the first request.
+        
+        Services and adapters are created immediately; the Bedrock client, the
+        slow part, connects on a background thread.
+        """
+        self.get_email_adapter()
+        self.get_notification_adapter()
+        self.get_payment_adapter()
+        email_generator = self.get_email_generator()
+        
+        if self._config.bedrock.use_mock:
+            return
+        
+        def connect_bedrock():
+            try:
+                email_generator.client
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Bedrock client prewarm failed: {e}")
+        
+        threading.Thread(target=connect_bedrock, name="bedrock-prewarm", daemon=True).start()
     
     # Configuration access
     def get_config(self) -> ApplicationConfig:
         """Get application configuration."""
         return self._config
     
+    def get_validation(self) -> dict:
+        """Get configuration validation results, computed once per container."""
+        validation = self._validation
+        if validation is None:
+            validation = self._validation = validate_configuration()
+        return validation
+    
     # Health check methods
     def health_check(self) -> dict:
         """Perform infrastructure health check."""
@@ -177,7 +243,6 @@ class InfrastructureContainer:
         }
         
         try:
-            from datetime import datetime
             results["timestamp"] = datetime.now().isoformat()
             
             # Check repositories
@@ -205,7 +270,7 @@ class InfrastructureContainer:
                 results["status"] = "degraded"
             
             # Check configuration
-            validation = validate_configuration()
+            validation = self.get_validation()
             if validation["valid"]:
                 results["checks"]["configuration"] = "valid"
             else:
@@ -240,9 +305,19 @@ def get_infrastructure_container(config: ApplicationConfig = None) -> Infrastruc
 
 
 def reset_infrastructure_container():
-    """Reset the global infrastructure container (useful for testing)."""
+    """Reset the global infrastructure container and cached singletons (useful for testing)."""
     global _infrastructure_container
     _infrastructure_container = None
+    
+    for factory in (
+        get_customer_repository,
+        get_invoice_repository,
+        get_payment_campaign_repository,
+        get_conversation_repository,
+        get_email_generator
+    ):
+        factory.cache_clear()
+    reset_service_adapters()
 
 
 # Infrastructure initialization
@@ -265,15 +340,18 @@ def initialize_infrastructure(config: ApplicationConfig = None) -> Infrastructur
     # Create and configure infrastructure container
     container = InfrastructureContainer(config)
     
-    # Validate configuration
-    validation = validate_configuration()
+    # Validate configuration (kept on the container for later health checks)
+    validation = container.get_validation()
     if not validation["valid"]:
-        import logging
         logger = logging.getLogger(__name__)
         logger.warning(f"Configuration issues detected: {validation['issues']}")
         if validation["warnings"]:
             logger.warning(f"Configuration warnings: {validation['warnings']}")
     
+    # Avoid a latency spike on the first request
+    if config.prewarm_services:
+        container.prewarm()
+    
     return container
 
 
@@ -314,10 +392,12 @@ __all__ = [
     'get_email_adapter',
     'get_notification_adapter',
     'get_payment_adapter',
+    'reset_service_adapters',
     'ServiceConfiguration',
     'service_config',
     
     # Configuration management
+    'Environment',
     'ApplicationConfig',
     'DatabaseConfig',
     'BedrockConfig',
@@ -5,9 +5,12 @@ This module provides integration with Amazon Bedrock Nova Micro model
 for generating personalized payment reminder emails and customer communications.
 """
 
-import json
-import boto3
+import asyncio
+import re
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,7 +22,69 @@ from ..domain.entities import Customer, OverdueInvoice
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Static instructions shared by every reminder request. Sent as the system
+# prompt ahead of a cache checkpoint so Bedrock reuses the processed tokens.
+EMAIL_SYSTEM_PROMPT = """
+You are an AI assistant specialized in generating professional payment reminder emails for B2B collections. 
+Generate a personalized email for the scenario described by the user.
+
+REQUIREMENTS:
+1. Generate a subject line that is clear and professional
+2. Create an email body that matches the desired tone
+3. Include specific payment options and next steps
+4. For escalation level 3, mention potential consequences professionally
+5. Always include a call to action
+6. Keep the tone appropriate for B2B communication
+7. Be empathetic but firm about payment expectations
+8. Write customer and invoice details as the [[placeholders]] given, exactly as written
+
+FORMAT YOUR RESPONSE AS:
+<email>
+<subject>Your generated subject line</subject>
+<body>
+Your complete email body here...
+</body>
+<tone_analysis>Brief analysis of the tone used</tone_analysis>
+<next_action>Suggested next action if no response</next_action>
+<escalation_note>Optional escalation recommendation if applicable</escalation_note>
+</email>
+"""
+
+# Descriptions substituted into the per-request part of the reminder prompt
+ESCALATION_CONTEXT = {
+    1: "first friendly reminder",
+    2: "second follow-up with urgency", 
+    3: "final notice before escalation"
+}
+
+TONE_GUIDANCE = {
+    "professional": "formal, respectful, and business-like",
+    "friendly": "warm, approachable, and understanding",
+    "firm": "assertive, direct, but still respectful",
+    "urgent": "pressing, serious, but not aggressive"
+}
+
+# Bands that stand in for exact overdue days and amounts in the prompt, so one
+# generated email serves every request that falls in the same bands
+OVERDUE_BAND_THRESHOLDS = (30, 60, 90)
+OVERDUE_BAND_LABELS = ("under 30 days", "30-59 days", "60-89 days", "90 days or more")
+AMOUNT_BAND_THRESHOLDS = (1000.0, 10000.0, 50000.0)
+AMOUNT_BAND_LABELS = ("small", "moderate", "large", "very large")
+
+# Customer-specific details the model writes as [[name]] and that are filled in per request
+PLACEHOLDER_PATTERN = re.compile(r"\[\[(\w+)\]\]")
+
+# Sections of the <email> response format, extracted in a single scan
+EMAIL_TAG_PATTERN = re.compile(
+    r"<(subject|body|tone_analysis|next_action|escalation_note)>(.*?)</\1>",
+    re.DOTALL
+)
+
+# Suggested follow-up when the model response has no <next_action> section
+DEFAULT_NEXT_ACTION = "Follow up in 3-5 business days"
+
+
+@dataclass(frozen=True, slots=True)
 class EmailGenerationRequest:
     """Request for generating an email using AI."""
     customer_name: str
@@ -35,7 +100,7 @@ class EmailGenerationRequest:
     tone: str = "professional"  # professional, friendly, firm, urgent
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmailGenerationResponse:
     """Response from AI email generation."""
     subject: str
@@ -50,30 +115,56 @@ class BedrockServiceError(Exception):
     pass
 
 
+@lru_cache(maxsize=8)
+def _bedrock_runtime_client(region_name: str):
+    """
+    Shared Bedrock runtime client per region.
+    
+    Clients are thread-safe, so every generator in a region reuses one
+    credential resolver and keep-alive connection pool. boto3 is imported
+    here so the mock generator never pays its import cost.
+    """
+    import boto3
+    from botocore.config import Config
+    
+    return boto3.session.Session().client(
+        'bedrock-runtime',
+        region_name=region_name,
+        config=Config(max_pool_connections=50, retries={'mode': 'adaptive'})
+    )
+
+
 class BedrockEmailGenerator:
     """Service for generating AI-powered payment emails using Amazon Bedrock."""
     
-    def __init__(self, region_name: str = "us-east-1", model_id: str = "amazon.nova-micro-v1:0"):
+    def __init__(
+        self,
+        region_name: str = "us-east-1",
+        model_id: str = "amazon.nova-micro-v1:0",
+        template_cache_size: int = 1024
+    ):
         """
         Initialize Bedrock email generator.
         
         Args:
             region_name: AWS region for Bedrock service
             model_id: Bedrock model identifier
+            template_cache_size: Generated email templates kept (0 disables caching)
         """
         self.model_id = model_id
         self.region_name = region_name
         self._client = None
+        
+        # Least-recently-used generated emails with placeholders, keyed by the placeholder prompt
+        self._template_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._template_cache_size = template_cache_size
     
     @property
     def client(self):
         """Lazy initialization of Bedrock client."""
         if self._client is None:
             try:
-                self._client = boto3.client(
-                    'bedrock-runtime',
-                    region_name=self.region_name
-                )
+                self._client = _bedrock_runtime_client(self.region_name)
             except Exception as e:
                 logger.error(f"Failed to initialize Bedrock client: {e}")
                 raise BedrockServiceError(f"Failed to connect to Bedrock: {e}")
@@ -95,91 +186,142 @@ class BedrockEmailGenerator:
         try:
             prompt = self._build_email_prompt(request)
             
-            # Prepare the request body for Nova Micro
-            request_body = {
-                "inputText": prompt,
-                "textGenerationConfig": {
-                    "maxTokenCount": 1000,
-                    "temperature": 0.7,
-                    "topP": 0.9,
-                    "stopSequences": ["</email>"]
-                }
-            }
-            
-            # Invoke the model
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body),
-                contentType='application/json',
-                accept='application/json'
-            )
-            
-            # Parse the response
-            response_body = json.loads(response['body'].read())
-            generated_text = response_body.get('results', [{}])[0].get('outputText', '')
+            # The prompt carries no customer details, so requests in the same bands share one email
+            generated_text = self._template_cache.get(prompt)
+            if generated_text is not None:
+                self._template_cache.move_to_end(prompt)
+            else:
+                # Static system prompt sits behind a cache point so Bedrock reuses it
+                generated_text = await self._converse(
+                    prompt,
+                    max_tokens=1000,
+                    temperature=0.7,
+                    top_p=0.9,
+                    system_prompt=EMAIL_SYSTEM_PROMPT,
+                    stop_sequences=["</email>"]
+                )
+                self._remember_template(prompt, generated_text)
             
-            return self._parse_email_response(generated_text, request)
+            # Fill in this request's details, then parse the response
+            return self._parse_email_response(self._fill_placeholders(generated_text, request), request)
             
         except Exception as e:
             logger.error(f"Failed to generate email: {e}")
             raise BedrockServiceError(f"Email generation failed: {e}")
     
-    def _build_email_prompt(self, request: EmailGenerationRequest) -> str:
-        """Build the prompt for email generation."""
+    async def generate_payment_reminder_emails(
+        self,
+        requests: List[EmailGenerationRequest],
+        concurrency: int = 10
+    ) -> List[EmailGenerationResponse]:
+        """
+        Generate payment reminder emails for many requests concurrently.
+        
+        Args:
+            requests: Email generation requests, one per invoice
+            concurrency: Maximum number of Bedrock calls in flight at once
+            
+        Returns:
+            EmailGenerationResponse list in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate(request: EmailGenerationRequest) -> EmailGenerationResponse:
+            async with semaphore:
+                return await self.generate_payment_reminder_email(request)
+        
+        return await asyncio.gather(*(generate(request) for request in requests))
+    
+    async def _converse(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        system_prompt: Optional[str] = None,
+        stop_sequences: Optional[List[str]] = None
+    ) -> str:
+        """
+        Send a single-turn prompt through the Converse API and return the reply text.
+        
+        The blocking boto3 call runs in a worker thread so the event loop stays free.
+        A system prompt is placed ahead of a cache checkpoint.
+        """
+        client = self.client
+        
+        inference_config = {
+            "maxTokens": max_tokens,
+            "temperature": temperature,
+            "topP": top_p
+        }
+        if stop_sequences:
+            inference_config["stopSequences"] = stop_sequences
         
-        escalation_context = {
-            1: "first friendly reminder",
-            2: "second follow-up with urgency", 
-            3: "final notice before escalation"
+        request = {
+            "modelId": self.model_id,
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+            "inferenceConfig": inference_config
         }
+        if system_prompt:
+            request["system"] = [
+                {"text": system_prompt},
+                {"cachePoint": {"type": "default"}}
+            ]
+        
+        response = await asyncio.to_thread(client.converse, **request)
         
-        tone_guidance = {
-            "professional": "formal, respectful, and business-like",
-            "friendly": "warm, approachable, and understanding",
-            "firm": "assertive, direct, but still respectful",
-            "urgent": "pressing, serious, but not aggressive"
+        content_blocks = response.get('output', {}).get('message', {}).get('content', [])
+        return "".join(block.get('text', '') for block in content_blocks)
+    
+    def _remember_template(self, prompt: str, generated_text: str) -> None:
+        """Keep a generated email for reuse, evicting the least recently used one."""
+        if self._template_cache_size <= 0 or not generated_text:
+            return
+        self._template_cache[prompt] = generated_text
+        if len(self._template_cache) > self._template_cache_size:
+            self._template_cache.popitem(last=False)
+    
+    def _fill_placeholders(self, generated_text: str, request: EmailGenerationRequest) -> str:
+        """Substitute a request's customer and invoice details for the [[placeholders]]."""
+        values = {
+            "customer_name": request.customer_name,
+            "company_name": request.company_name or "",
+            "invoice_number": request.invoice_number,
+            "amount_due": f"{request.currency} {request.invoice_amount:,.2f}",
+            "due_date": request.due_date.strftime('%B %d, %Y'),
+            "days_overdue": str(request.days_overdue)
         }
+        return PLACEHOLDER_PATTERN.sub(lambda match: values.get(match.group(1), match.group(0)), generated_text)
+    
+    def _build_email_prompt(self, request: EmailGenerationRequest) -> str:
+        """
+        Build the request-specific part of the email prompt (see EMAIL_SYSTEM_PROMPT).
+        
+        Customer details appear only as [[placeholders]] and exact days and amounts
+        only as bands, so the prompt doubles as the template cache key.
+        """
+        escalation_context = ESCALATION_CONTEXT.get(request.escalation_level, 'unknown')
+        tone_guidance = TONE_GUIDANCE.get(request.tone, 'professional')
+        overdue_band = OVERDUE_BAND_LABELS[bisect_right(OVERDUE_BAND_THRESHOLDS, request.days_overdue)]
+        amount_band = AMOUNT_BAND_LABELS[bisect_right(AMOUNT_BAND_THRESHOLDS, request.invoice_amount)]
         
         prompt = f"""
-You are an AI assistant specialized in generating professional payment reminder emails for B2B collections. 
-Generate a personalized email for the following scenario:
-
 CUSTOMER INFORMATION:
-- Customer Name: {request.customer_name}
-- Company: {request.company_name or 'N/A'}
+- Customer Name: [[customer_name]]
+- Company: {'[[company_name]]' if request.company_name else 'N/A'}
 
 INVOICE DETAILS:
-- Invoice Number: {request.invoice_number}
-- Amount Due: {request.currency} {request.invoice_amount:,.2f}
-- Original Due Date: {request.due_date.strftime('%B %d, %Y')}
-- Days Overdue: {request.days_overdue} days
+- Invoice Number: [[invoice_number]]
+- Amount Due: [[amount_due]] ({amount_band} balance)
+- Original Due Date: [[due_date]]
+- Days Overdue: [[days_overdue]] days ({overdue_band})
 
 CONTEXT:
-- Escalation Level: {request.escalation_level} ({escalation_context.get(request.escalation_level, 'unknown')})
-- Desired Tone: {request.tone} ({tone_guidance.get(request.tone, 'professional')})
+- Escalation Level: {request.escalation_level} ({escalation_context})
+- Desired Tone: {request.tone} ({tone_guidance})
 - Payment History: {request.payment_history or 'No specific history provided'}
 - Additional Context: {request.custom_context or 'None'}
 
-REQUIREMENTS:
-1. Generate a subject line that is clear and professional
-2. Create an email body that is {tone_guidance.get(request.tone, 'professional')}
-3. Include specific payment options and next steps
-4. For escalation level 3, mention potential consequences professionally
-5. Always include a call to action
-6. Keep the tone appropriate for B2B communication
-7. Be empathetic but firm about payment expectations
-
-FORMAT YOUR RESPONSE AS:
-<email>
-<subject>Your generated subject line</subject>
-<body>
-Your complete email body here...
-</body>
-<tone_analysis>Brief analysis of the tone used</tone_analysis>
-<next_action>Suggested next action if no response</next_action>
-<escalation_note>Optional escalation recommendation if applicable</escalation_note>
-</email>
-
 Generate the email now:
 """
         return prompt
@@ -192,25 +334,18 @@ Generate the email now:
         """Parse the AI-generated email response."""
         
         try:
-            # Extract content between tags
-            subject = self._extract_tag_content(generated_text, 'subject')
-            body = self._extract_tag_content(generated_text, 'body')
-            tone_analysis = self._extract_tag_content(generated_text, 'tone_analysis')
-            next_action = self._extract_tag_content(generated_text, 'next_action')
-            escalation_note = self._extract_tag_content(generated_text, 'escalation_note')
-            
-            # Fallback parsing if tags aren't found
-            if not subject or not body:
-                lines = generated_text.strip().split('\n')
-                subject = subject or f"Payment Reminder - Invoice {request.invoice_number}"
-                body = body or generated_text
+            # Extract content between tags, keeping the first occurrence of each
+            tags = {}
+            for match in EMAIL_TAG_PATTERN.finditer(generated_text):
+                tags.setdefault(match.group(1), match.group(2).strip())
             
+            # Missing subject or body fall back to defaults and the raw text
             return EmailGenerationResponse(
-                subject=subject or f"Payment Reminder - Invoice {request.invoice_number}",
-                body=body or "Payment reminder email content could not be generated.",
-                tone_analysis=tone_analysis or f"Generated with {request.tone} tone",
-                suggested_next_action=next_action or "Follow up in 3-5 business days",
-                escalation_recommendation=escalation_note
+                subject=tags.get('subject') or f"Payment Reminder - Invoice {request.invoice_number}",
+                body=tags.get('body') or generated_text or "Payment reminder email content could not be generated.",
+                tone_analysis=tags.get('tone_analysis') or f"Generated with {request.tone} tone",
+                suggested_next_action=tags.get('next_action') or DEFAULT_NEXT_ACTION,
+                escalation_recommendation=tags.get('escalation_note')
             )
             
         except Exception as e:
@@ -221,29 +356,9 @@ Generate the email now:
                 subject=f"Payment Reminder - Invoice {request.invoice_number}",
                 body=generated_text,
                 tone_analysis=f"Generated with {request.tone} tone",
-                suggested_next_action="Follow up in 3-5 business days"
+                suggested_next_action=DEFAULT_NEXT_ACTION
             )
     
-    def _extract_tag_content(self, text: str, tag: str) -> Optional[str]:
-        """Extract content between XML-like tags."""
-        try:
-            start_tag = f"<{tag}>"
-            end_tag = f"</{tag}>"
-            
-            start_index = text.find(start_tag)
-            if start_index == -1:
-                return None
-            
-            start_index += len(start_tag)
-            end_index = text.find(end_tag, start_index)
-            
-            if end_index == -1:
-                return None
-            
-            return text[start_index:end_index].strip()
-        except Exception:
-            return None
-    
     async def generate_conversation_response(
         self,
         customer_message: str,
@@ -286,25 +401,13 @@ GUIDELINES:
 Generate a helpful response:
 """
             
-            request_body = {
-                "inputText": prompt,
-                "textGenerationConfig": {
-                    "maxTokenCount": 500,
-                    "temperature": 0.6,
-                    "topP": 0.8
-                }
-            }
-            
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body),
-                contentType='application/json',
-                accept='application/json'
+            generated_text = await self._converse(
+                prompt,
+                max_tokens=500,
+                temperature=0.6,
+                top_p=0.8
             )
             
-            response_body = json.loads(response['body'].read())
-            generated_text = response_body.get('results', [{}])[0].get('outputText', '')
-            
             return generated_text.strip()
             
         except Exception as e:
@@ -391,13 +494,8 @@ def create_email_generator(use_mock: bool = False) -> BedrockEmailGenerator:
         return BedrockEmailGenerator()
 
 
-# Singleton instance
-_email_generator = None
-
-
+# Singleton instance per implementation, so mock and real generators can coexist
+@lru_cache(maxsize=None)
 def get_email_generator(use_mock: bool = False) -> BedrockEmailGenerator:
     """Get singleton email generator instance."""
-    global _email_generator
-    if _email_generator is None:
-        _email_generator = create_email_generator(use_mock=use_mock)
-    return _email_generator
\ No newline at end of file
+    return create_email_generator(use_mock=use_mock)
\ No newline at end of file
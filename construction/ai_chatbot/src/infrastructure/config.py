@@ -6,16 +6,41 @@ for different deployment environments (development, testing, production).
 """
 
 import os
+import re
+import sys
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
+# KEY=value lines of a .env file; comments, blank lines and empty values never match
+ENV_LINE_PATTERN = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?\S)[ \t\r]*$",
+    re.MULTILINE
+)
 
-@dataclass
+# Entries of a comma-separated origin list, without surrounding whitespace or empty entries
+CORS_ORIGIN_PATTERN = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+class Environment(Enum):
+    """Deployment environments the application recognises."""
+    DEVELOPMENT = "development"
+    TESTING = "testing"
+    STAGING = "staging"
+    PRODUCTION = "production"
+
+
+# Environment names, lowercased, mapped to their enum member
+_ENVIRONMENTS = {environment.value: environment for environment in Environment}
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration settings."""
     use_in_memory: bool = True
@@ -26,7 +51,7 @@ class DatabaseConfig:
     customers_table: str = "Customers"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedrockConfig:
     """Amazon Bedrock configuration settings."""
     region: str = "us-east-1"
@@ -37,7 +62,7 @@ class BedrockConfig:
     use_mock: bool = True  # Use mock for development by default
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EmailConfig:
     """Email service configuration."""
     adapter_type: str = "mock"  # mock, smtp
@@ -50,7 +75,7 @@ class EmailConfig:
     from_name: str = "Payment Intelligence System"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationConfig:
     """Notification service configuration."""
     adapter_type: str = "logging"  # logging, sns, webhook
@@ -58,7 +83,7 @@ class NotificationConfig:
     webhook_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaymentConfig:
     """Payment service configuration."""
     adapter_type: str = "mock"  # mock, stripe, square
@@ -67,18 +92,18 @@ class PaymentConfig:
     processing_fee_rate: float = 0.025  # 2.5%
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SecurityConfig:
     """Security configuration settings."""
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
     api_key_header: str = "X-API-Key"
-    cors_origins: list = field(default_factory=lambda: ["http://localhost:3000"])
+    cors_origins: Tuple[str, ...] = ("http://localhost:3000",)
     rate_limit_per_minute: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration settings."""
     level: str = "INFO"
@@ -88,15 +113,16 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ApplicationConfig:
-    """Main application configuration."""
+    """Main application configuration. Immutable; derive variants with dataclasses.replace."""
     environment: str = "development"
     debug: bool = True
     version: str = "1.0.0"
     service_name: str = "AI Payment Intelligence"
     host: str = "localhost"
     port: int = 8000
+    prewarm_services: bool = True  # Create services at startup instead of on first request
     
     # Sub-configurations
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
@@ -106,6 +132,12 @@ class ApplicationConfig:
     payment: PaymentConfig = field(default_factory=PaymentConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
+    
+    # Resolved from environment once; None for names outside Environment
+    environment_kind: Optional[Environment] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'environment_kind', _ENVIRONMENTS.get(self.environment.lower()))
 
 
 class ConfigurationManager:
@@ -128,13 +160,8 @@ class ConfigurationManager:
     def _load_env_file(self, env_file: str) -> None:
         """Load environment variables from file."""
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, _, value = line.partition('=')
-                        if key and value:
-                            os.environ[key.strip()] = value.strip()
+            variables = dict(ENV_LINE_PATTERN.findall(Path(env_file).read_text()))
+            os.environ.update(variables)
             logger.info(f"Loaded environment variables from {env_file}")
         except Exception as e:
             logger.warning(f"Failed to load environment file {env_file}: {e}")
@@ -147,85 +174,100 @@ class ConfigurationManager:
     
     def _build_config(self) -> ApplicationConfig:
         """Build configuration from environment variables."""
+        # Read the environment once rather than going through os.environ per setting
+        env = dict(os.environ)
         
-        # Main application config
-        config = ApplicationConfig(
-            environment=os.getenv("ENVIRONMENT", "development"),
-            debug=os.getenv("DEBUG", "true").lower() == "true",
-            version=os.getenv("VERSION", "1.0.0"),
-            service_name=os.getenv("SERVICE_NAME", "AI Payment Intelligence"),
-            host=os.getenv("HOST", "localhost"),
-            port=int(os.getenv("PORT", "8000"))
-        )
+        def flag(name: str, default: str) -> bool:
+            return env.get(name, default).lower() == "true"
+        
+        # Short identifiers compared against literals elsewhere are interned
+        def symbol(name: str, default: str) -> str:
+            return sys.intern(env.get(name, default))
         
         # Database configuration
-        config.database = DatabaseConfig(
-            use_in_memory=os.getenv("USE_IN_MEMORY_DB", "true").lower() == "true",
-            dynamodb_region=os.getenv("DYNAMODB_REGION", "us-east-1"),
-            campaigns_table=os.getenv("DYNAMODB_CAMPAIGNS_TABLE", "PaymentCampaigns"),
-            conversations_table=os.getenv("DYNAMODB_CONVERSATIONS_TABLE", "Conversations"),
-            invoices_table=os.getenv("DYNAMODB_INVOICES_TABLE", "OverdueInvoices"),
-            customers_table=os.getenv("DYNAMODB_CUSTOMERS_TABLE", "Customers")
+        database = DatabaseConfig(
+            use_in_memory=flag("USE_IN_MEMORY_DB", "true"),
+            dynamodb_region=symbol("DYNAMODB_REGION", "us-east-1"),
+            campaigns_table=env.get("DYNAMODB_CAMPAIGNS_TABLE", "PaymentCampaigns"),
+            conversations_table=env.get("DYNAMODB_CONVERSATIONS_TABLE", "Conversations"),
+            invoices_table=env.get("DYNAMODB_INVOICES_TABLE", "OverdueInvoices"),
+            customers_table=env.get("DYNAMODB_CUSTOMERS_TABLE", "Customers")
         )
         
         # Bedrock configuration
-        config.bedrock = BedrockConfig(
-            region=os.getenv("BEDROCK_REGION", "us-east-1"),
-            model_id=os.getenv("BEDROCK_MODEL_ID", "amazon.nova-micro-v1:0"),
-            max_tokens=int(os.getenv("BEDROCK_MAX_TOKENS", "1000")),
-            temperature=float(os.getenv("BEDROCK_TEMPERATURE", "0.7")),
-            top_p=float(os.getenv("BEDROCK_TOP_P", "0.9")),
-            use_mock=os.getenv("BEDROCK_USE_MOCK", "true").lower() == "true"
+        bedrock = BedrockConfig(
+            region=symbol("BEDROCK_REGION", "us-east-1"),
+            model_id=symbol("BEDROCK_MODEL_ID", "amazon.nova-micro-v1:0"),
+            max_tokens=int(env.get("BEDROCK_MAX_TOKENS", "1000")),
+            temperature=float(env.get("BEDROCK_TEMPERATURE", "0.7")),
+            top_p=float(env.get("BEDROCK_TOP_P", "0.9")),
+            use_mock=flag("BEDROCK_USE_MOCK", "true")
         )
         
         # Email configuration
-        config.email = EmailConfig(
-            adapter_type=os.getenv("EMAIL_ADAPTER_TYPE", "mock"),
-            smtp_server=os.getenv("SMTP_SERVER"),
-            smtp_port=int(os.getenv("SMTP_PORT", "587")),
-            username=os.getenv("SMTP_USERNAME"),
-            password=os.getenv("SMTP_PASSWORD"),
-            use_tls=os.getenv("SMTP_USE_TLS", "true").lower() == "true",
-            from_email=os.getenv("FROM_EMAIL", "noreply@payment-intelligence.com"),
-            from_name=os.getenv("FROM_NAME", "Payment Intelligence System")
+        email = EmailConfig(
+            adapter_type=symbol("EMAIL_ADAPTER_TYPE", "mock"),
+            smtp_server=env.get("SMTP_SERVER"),
+            smtp_port=int(env.get("SMTP_PORT", "587")),
+            username=env.get("SMTP_USERNAME"),
+            password=env.get("SMTP_PASSWORD"),
+            use_tls=flag("SMTP_USE_TLS", "true"),
+            from_email=env.get("FROM_EMAIL", "noreply@payment-intelligence.com"),
+            from_name=env.get("FROM_NAME", "Payment Intelligence System")
         )
         
         # Notification configuration
-        config.notification = NotificationConfig(
-            adapter_type=os.getenv("NOTIFICATION_ADAPTER_TYPE", "logging"),
-            sns_topic_arn=os.getenv("SNS_TOPIC_ARN"),
-            webhook_url=os.getenv("NOTIFICATION_WEBHOOK_URL")
+        notification = NotificationConfig(
+            adapter_type=symbol("NOTIFICATION_ADAPTER_TYPE", "logging"),
+            sns_topic_arn=env.get("SNS_TOPIC_ARN"),
+            webhook_url=env.get("NOTIFICATION_WEBHOOK_URL")
         )
         
         # Payment configuration
-        config.payment = PaymentConfig(
-            adapter_type=os.getenv("PAYMENT_ADAPTER_TYPE", "mock"),
-            api_key=os.getenv("PAYMENT_API_KEY"),
-            success_rate=float(os.getenv("PAYMENT_SUCCESS_RATE", "0.9")),
-            processing_fee_rate=float(os.getenv("PAYMENT_FEE_RATE", "0.025"))
+        payment = PaymentConfig(
+            adapter_type=symbol("PAYMENT_ADAPTER_TYPE", "mock"),
+            api_key=env.get("PAYMENT_API_KEY"),
+            success_rate=float(env.get("PAYMENT_SUCCESS_RATE", "0.9")),
+            processing_fee_rate=float(env.get("PAYMENT_FEE_RATE", "0.025"))
         )
         
         # Security configuration
-        cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000")
-        config.security = SecurityConfig(
-            jwt_secret_key=os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production"),
-            jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
-            jwt_expiration_hours=int(os.getenv("JWT_EXPIRATION_HOURS", "24")),
-            api_key_header=os.getenv("API_KEY_HEADER", "X-API-Key"),
-            cors_origins=[origin.strip() for origin in cors_origins.split(",")],
-            rate_limit_per_minute=int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
+        cors_origins = env.get("CORS_ORIGINS", "http://localhost:3000")
+        security = SecurityConfig(
+            jwt_secret_key=env.get("JWT_SECRET_KEY", "your-secret-key-change-in-production"),
+            jwt_algorithm=symbol("JWT_ALGORITHM", "HS256"),
+            jwt_expiration_hours=int(env.get("JWT_EXPIRATION_HOURS", "24")),
+            api_key_header=symbol("API_KEY_HEADER", "X-API-Key"),
+            cors_origins=tuple(CORS_ORIGIN_PATTERN.findall(cors_origins)),
+            rate_limit_per_minute=int(env.get("RATE_LIMIT_PER_MINUTE", "60"))
         )
         
         # Logging configuration
-        config.logging = LoggingConfig(
-            level=os.getenv("LOG_LEVEL", "INFO"),
-            format=os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            file_path=os.getenv("LOG_FILE_PATH"),
-            max_file_size_mb=int(os.getenv("LOG_MAX_FILE_SIZE_MB", "10")),
-            backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5"))
+        logging_config = LoggingConfig(
+            level=symbol("LOG_LEVEL", "INFO"),
+            format=env.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
+            file_path=env.get("LOG_FILE_PATH"),
+            max_file_size_mb=int(env.get("LOG_MAX_FILE_SIZE_MB", "10")),
+            backup_count=int(env.get("LOG_BACKUP_COUNT", "5"))
         )
         
-        return config
+        # Main application config
+        return ApplicationConfig(
+            environment=symbol("ENVIRONMENT", "development"),
+            debug=flag("DEBUG", "true"),
+            version=env.get("VERSION", "1.0.0"),
+            service_name=env.get("SERVICE_NAME", "AI Payment Intelligence"),
+            host=env.get("HOST", "localhost"),
+            port=int(env.get("PORT", "8000")),
+            prewarm_services=flag("PREWARM_SERVICES", "true"),
+            database=database,
+            bedrock=bedrock,
+            email=email,
+            notification=notification,
+            payment=payment,
+            security=security,
+            logging=logging_config
+        )
     
     def validate_config(self) -> Dict[str, Any]:
         """Validate configuration and return validation results."""
@@ -279,11 +321,11 @@ class ConfigurationManager:
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.get_config().environment.lower() == "production"
+        return self.get_config().environment_kind is Environment.PRODUCTION
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.get_config().environment.lower() == "development"
+        return self.get_config().environment_kind is Environment.DEVELOPMENT
 
 
 # Global configuration manager instance
@@ -310,45 +352,68 @@ def validate_configuration() -> Dict[str, Any]:
 # Environment-specific configuration helpers
 def get_development_config() -> ApplicationConfig:
     """Get configuration optimized for development."""
-    config = get_config()
-    config.debug = True
-    config.bedrock.use_mock = True
-    config.email.adapter_type = "mock"
-    config.payment.adapter_type = "mock"
-    config.database.use_in_memory = True
-    return config
+    return _development_config(get_config())
 
 
 def get_production_config() -> ApplicationConfig:
     """Get configuration optimized for production."""
-    config = get_config()
-    config.debug = False
-    config.bedrock.use_mock = False
-    config.email.adapter_type = "smtp"
-    config.payment.adapter_type = "stripe"  # or actual payment provider
-    config.database.use_in_memory = False
-    return config
+    return _production_config(get_config())
+
+
+# Derived once per base configuration, so repeated calls return the same object
+@lru_cache(maxsize=1)
+def _development_config(config: ApplicationConfig) -> ApplicationConfig:
+    return replace(
+        config,
+        debug=True,
+        bedrock=replace(config.bedrock, use_mock=True),
+        email=replace(config.email, adapter_type="mock"),
+        payment=replace(config.payment, adapter_type="mock"),
+        database=replace(config.database, use_in_memory=True)
+    )
+
+
+@lru_cache(maxsize=1)
+def _production_config(config: ApplicationConfig) -> ApplicationConfig:
+    return replace(
+        config,
+        debug=False,
+        bedrock=replace(config.bedrock, use_mock=False),
+        email=replace(config.email, adapter_type="smtp"),
+        payment=replace(config.payment, adapter_type="stripe"),  # or actual payment provider
+        database=replace(config.database, use_in_memory=False)
+    )
+
+
+# Handlers added to the root logger by setup_logging, and the config they were built from
+_logging_handlers: List[logging.Handler] = []
+_logging_config: Optional[LoggingConfig] = None
 
 
 def setup_logging(config: Optional[LoggingConfig] = None) -> None:
-    """Setup logging based on configuration."""
+    """Setup logging based on configuration, replacing handlers from earlier calls."""
+    global _logging_config
     if config is None:
         config = get_config().logging
     
-    log_level = getattr(logging, config.level.upper(), logging.INFO)
+    # Already configured this way; adding handlers again would duplicate every record
+    if config == _logging_config:
+        return
+    
+    root_logger = logging.getLogger()
+    for handler in _logging_handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
+    _logging_handlers.clear()
     
-    # Configure logging
-    logging_config = {
-        'level': log_level,
-        'format': config.format,
-        'handlers': []
-    }
+    log_level = getattr(logging, config.level.upper(), logging.INFO)
+    formatter = logging.Formatter(config.format)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    formatter = logging.Formatter(config.format)
     console_handler.setFormatter(formatter)
+    _logging_handlers.append(console_handler)
     
     # File handler if specified
     if config.file_path:
@@ -360,10 +425,12 @@ def setup_logging(config: Optional[LoggingConfig] = None) -> None:
         )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(file_handler)
+        _logging_handlers.append(file_handler)
     
-    logging.getLogger().addHandler(console_handler)
-    logging.getLogger().setLevel(log_level)
+    for handler in _logging_handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(log_level)
+    _logging_config = config
     
     logger.info(f"Logging configured - Level: {config.level}, File: {config.file_path}")
 
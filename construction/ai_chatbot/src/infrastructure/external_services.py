@@ -5,12 +5,15 @@ This module provides adapters for integrating with external services
 following the Adapter pattern for clean separation of concerns.
 """
 
+import asyncio
 import logging
+import random
 import smtplib
 from abc import ABC, abstractmethod
+from email.mime.base import MIMEBase
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -19,8 +22,14 @@ from ..domain.value_objects import CustomerId, InvoiceId
 
 logger = logging.getLogger(__name__)
 
+# Random source for simulated payment outcomes
+_rng = random.Random()
 
-@dataclass
+# Payment methods accepted by the mock payment adapter
+_VALID_PAYMENT_METHODS = frozenset({"credit_card", "bank_transfer", "ach", "wire_transfer"})
+
+
+@dataclass(frozen=True, slots=True)
 class EmailMessage:
     """Email message data structure."""
     to_email: str
@@ -32,7 +41,7 @@ class EmailMessage:
     attachments: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotificationMessage:
     """Notification message data structure."""
     recipient_id: str
@@ -43,7 +52,7 @@ class NotificationMessage:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaymentRequest:
     """Payment processing request."""
     invoice_id: str
@@ -117,42 +126,80 @@ class SMTPEmailAdapter(EmailServiceAdapter):
         self.password = password
         self.use_tls = use_tls
     
+    def _build_mime(self, message: EmailMessage) -> MIMEBase:
+        """Build the MIME message for an email."""
+        body_part = MIMEText(message.body, 'html' if message.is_html else 'plain')
+        
+        # A lone body goes out single-part; only attachments need a multipart container
+        if message.attachments:
+            msg = MIMEMultipart('alternative')
+            msg.attach(body_part)
+        else:
+            msg = body_part
+        
+        msg['Subject'] = message.subject
+        msg['From'] = f"{message.from_name} <{message.from_email}>"
+        msg['To'] = message.to_email
+        return msg
+    
+    def _open_session(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP session."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            if self.use_tls:
+                server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
     async def send_email(self, message: EmailMessage) -> bool:
         """Send email via SMTP."""
+        return await asyncio.to_thread(self._send_email, message)
+    
+    def _send_email(self, message: EmailMessage) -> bool:
+        """Build and send one email on its own SMTP session; blocks until done."""
         try:
             # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = message.subject
-            msg['From'] = f"{message.from_name} <{message.from_email}>"
-            msg['To'] = message.to_email
-            
-            # Add body
-            if message.is_html:
-                body_part = MIMEText(message.body, 'html')
-            else:
-                body_part = MIMEText(message.body, 'plain')
-            
-            msg.attach(body_part)
+            msg = self._build_mime(message)
             
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                server.login(self.username, self.password)
+            with self._open_session() as server:
                 server.send_message(msg)
             
-            logger.info(f"Email sent successfully to {message.to_email}")
+            logger.info("Email sent successfully to %s", message.to_email)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to send email to {message.to_email}: {e}")
+            logger.error("Failed to send email to %s: %s", message.to_email, e)
             return False
     
     async def send_bulk_emails(self, messages: List[EmailMessage]) -> Dict[str, bool]:
-        """Send multiple emails."""
+        """Send multiple emails over a single SMTP session."""
+        if not messages:
+            return {}
+        return await asyncio.to_thread(self._send_bulk_emails, messages)
+    
+    def _send_bulk_emails(self, messages: List[EmailMessage]) -> Dict[str, bool]:
+        """Send emails in sequence, sharing one connection, login and TLS handshake."""
         results = {}
+        try:
+            with self._open_session() as server:
+                for message in messages:
+                    try:
+                        server.send_message(self._build_mime(message))
+                        logger.info("Email sent successfully to %s", message.to_email)
+                        results[message.to_email] = True
+                    except Exception as e:
+                        logger.error("Failed to send email to %s: %s", message.to_email, e)
+                        results[message.to_email] = False
+        except Exception as e:
+            logger.error("SMTP session for bulk send failed: %s", e)
+        
+        # Messages never attempted because the session failed count as not sent
         for message in messages:
-            results[message.to_email] = await self.send_email(message)
+            results.setdefault(message.to_email, False)
         return results
 
 
@@ -166,19 +213,20 @@ class MockEmailAdapter(EmailServiceAdapter):
     async def send_email(self, message: EmailMessage) -> bool:
         """Mock send email."""
         self.sent_emails.append(message)
-        logger.info(f"Mock email sent to {message.to_email}: {message.subject}")
+        logger.info("Mock email sent to %s: %s", message.to_email, message.subject)
         return True
     
     async def send_bulk_emails(self, messages: List[EmailMessage]) -> Dict[str, bool]:
-        """Mock send bulk emails."""
-        results = {}
-        for message in messages:
-            results[message.to_email] = await self.send_email(message)
-        return results
+        """Mock send bulk emails concurrently."""
+        results = await asyncio.gather(
+            *(self.send_email(message) for message in messages),
+            return_exceptions=True
+        )
+        return {message.to_email: result is True for message, result in zip(messages, results)}
     
-    def get_sent_emails(self) -> List[EmailMessage]:
-        """Get list of sent emails for testing."""
-        return self.sent_emails.copy()
+    def get_sent_emails(self) -> Tuple[EmailMessage, ...]:
+        """Get list of sent emails for testing (immutable snapshot)."""
+        return tuple(self.sent_emails)
     
     def clear_sent_emails(self) -> None:
         """Clear sent emails list."""
@@ -197,26 +245,42 @@ class LoggingNotificationAdapter(NotificationServiceAdapter):
         try:
             self.sent_notifications.append(notification)
             logger.info(
-                f"Notification sent - Type: {notification.notification_type}, "
-                f"Recipient: {notification.recipient_id}, "
-                f"Title: {notification.title}, "
-                f"Priority: {notification.priority}"
+                "Notification sent - Type: %s, Recipient: %s, Title: %s, Priority: %s",
+                notification.notification_type,
+                notification.recipient_id,
+                notification.title,
+                notification.priority
             )
             return True
         except Exception as e:
-            logger.error(f"Failed to send notification: {e}")
+            logger.error("Failed to send notification: %s", e)
             return False
     
     async def send_bulk_notifications(self, notifications: List[NotificationMessage]) -> Dict[str, bool]:
-        """Send multiple notifications."""
-        results = {}
-        for notification in notifications:
-            results[notification.recipient_id] = await self.send_notification(notification)
-        return results
+        """Send multiple notifications, logging one summary line for the batch."""
+        self.sent_notifications.extend(notifications)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Notification batch sent - Count: %d, Types: %s",
+                len(notifications),
+                ", ".join(sorted({notification.notification_type for notification in notifications}))
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            for notification in notifications:
+                logger.debug(
+                    "Notification sent - Type: %s, Recipient: %s, Title: %s, Priority: %s",
+                    notification.notification_type,
+                    notification.recipient_id,
+                    notification.title,
+                    notification.priority
+                )
+        
+        return {notification.recipient_id: True for notification in notifications}
     
-    def get_sent_notifications(self) -> List[NotificationMessage]:
-        """Get sent notifications for testing."""
-        return self.sent_notifications.copy()
+    def get_sent_notifications(self) -> Tuple[NotificationMessage, ...]:
+        """Get sent notifications for testing (immutable snapshot)."""
+        return tuple(self.sent_notifications)
 
 
 class MockPaymentAdapter(PaymentServiceAdapter):
@@ -229,61 +293,78 @@ class MockPaymentAdapter(PaymentServiceAdapter):
     
     async def process_payment(self, payment_request: PaymentRequest) -> Dict[str, Any]:
         """Mock payment processing."""
+        # One clock read shared by the transaction id and timestamps
+        now = datetime.now()
+        timestamp = now.isoformat()
+        
         try:
             self.processed_payments.append(payment_request)
             
             # Simulate payment processing
-            import random
-            success = random.random() < self.payment_success_rate
+            success = _rng.random() < self.payment_success_rate
             
             if success:
+                amount = payment_request.amount
+                processing_fee = amount * 0.025  # 2.5% fee
                 result = {
                     "status": "success",
-                    "transaction_id": f"txn_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                    "amount_processed": payment_request.amount,
+                    "transaction_id": f"txn_{now.strftime('%Y%m%d_%H%M%S')}",
+                    "amount_processed": amount,
                     "currency": payment_request.currency,
-                    "processing_fee": payment_request.amount * 0.025,  # 2.5% fee
-                    "net_amount": payment_request.amount * 0.975,
-                    "timestamp": datetime.now().isoformat()
+                    "processing_fee": processing_fee,
+                    "net_amount": amount - processing_fee,
+                    "timestamp": timestamp
                 }
-                logger.info(f"Mock payment processed successfully: {result['transaction_id']}")
+                logger.info("Mock payment processed successfully: %s", result['transaction_id'])
             else:
                 result = {
                     "status": "failed",
                     "error_code": "INSUFFICIENT_FUNDS",
                     "error_message": "Mock payment failure for testing",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                logger.warning(f"Mock payment failed for invoice {payment_request.invoice_id}")
+                logger.warning("Mock payment failed for invoice %s", payment_request.invoice_id)
             
             return result
             
         except Exception as e:
-            logger.error(f"Payment processing error: {e}")
+            logger.error("Payment processing error: %s", e)
             return {
                 "status": "error",
                 "error_message": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
     
     async def validate_payment_method(self, payment_method: str, customer_id: str) -> bool:
         """Mock payment method validation."""
         # Simple validation logic for testing
-        valid_methods = ["credit_card", "bank_transfer", "ach", "wire_transfer"]
-        is_valid = payment_method.lower() in valid_methods
+        is_valid = payment_method.lower() in _VALID_PAYMENT_METHODS
         
-        logger.info(f"Payment method validation - Method: {payment_method}, Valid: {is_valid}")
+        logger.info("Payment method validation - Method: %s, Valid: %s", payment_method, is_valid)
         return is_valid
     
-    def get_processed_payments(self) -> List[PaymentRequest]:
-        """Get processed payments for testing."""
-        return self.processed_payments.copy()
+    def get_processed_payments(self) -> Tuple[PaymentRequest, ...]:
+        """Get processed payments for testing (immutable snapshot)."""
+        return tuple(self.processed_payments)
     
     def set_success_rate(self, rate: float) -> None:
         """Set payment success rate for testing."""
         self.payment_success_rate = max(0.0, min(1.0, rate))
 
 
+# Adapter constructors by type; the mock email adapter takes no settings
+_EMAIL_ADAPTERS = {
+    "smtp": SMTPEmailAdapter,
+    "mock": lambda **kwargs: MockEmailAdapter()
+}
+_NOTIFICATION_ADAPTERS = {
+    "logging": LoggingNotificationAdapter
+}
+_PAYMENT_ADAPTERS = {
+    "mock": MockPaymentAdapter
+}
+
+
 # Service adapters factory
 class ServiceAdapterFactory:
     """Factory for creating service adapter instances."""
@@ -291,58 +372,63 @@ class ServiceAdapterFactory:
     @staticmethod
     def create_email_adapter(adapter_type: str = "mock", **kwargs) -> EmailServiceAdapter:
         """Create email adapter."""
-        if adapter_type == "smtp":
-            return SMTPEmailAdapter(**kwargs)
-        elif adapter_type == "mock":
-            return MockEmailAdapter()
-        else:
+        adapter_class = _EMAIL_ADAPTERS.get(adapter_type)
+        if adapter_class is None:
             raise ValueError(f"Unknown email adapter type: {adapter_type}")
+        return adapter_class(**kwargs)
     
     @staticmethod
     def create_notification_adapter(adapter_type: str = "logging") -> NotificationServiceAdapter:
         """Create notification adapter."""
-        if adapter_type == "logging":
-            return LoggingNotificationAdapter()
-        else:
+        adapter_class = _NOTIFICATION_ADAPTERS.get(adapter_type)
+        if adapter_class is None:
             raise ValueError(f"Unknown notification adapter type: {adapter_type}")
+        return adapter_class()
     
     @staticmethod
     def create_payment_adapter(adapter_type: str = "mock") -> PaymentServiceAdapter:
         """Create payment adapter."""
-        if adapter_type == "mock":
-            return MockPaymentAdapter()
-        else:
+        adapter_class = _PAYMENT_ADAPTERS.get(adapter_type)
+        if adapter_class is None:
             raise ValueError(f"Unknown payment adapter type: {adapter_type}")
+        return adapter_class()
 
 
-# Singleton instances for MVP
-_email_adapter = None
-_notification_adapter = None
-_payment_adapter = None
+# Singleton instances per adapter type for MVP; settings apply on first creation
+_email_adapters: Dict[str, EmailServiceAdapter] = {}
+_notification_adapters: Dict[str, NotificationServiceAdapter] = {}
+_payment_adapters: Dict[str, PaymentServiceAdapter] = {}
 
 
 def get_email_adapter(adapter_type: str = "mock", **kwargs) -> EmailServiceAdapter:
     """Get singleton email adapter instance."""
-    global _email_adapter
-    if _email_adapter is None:
-        _email_adapter = ServiceAdapterFactory.create_email_adapter(adapter_type, **kwargs)
-    return _email_adapter
+    adapter = _email_adapters.get(adapter_type)
+    if adapter is None:
+        adapter = _email_adapters[adapter_type] = ServiceAdapterFactory.create_email_adapter(adapter_type, **kwargs)
+    return adapter
 
 
 def get_notification_adapter(adapter_type: str = "logging") -> NotificationServiceAdapter:
     """Get singleton notification adapter instance."""
-    global _notification_adapter
-    if _notification_adapter is None:
-        _notification_adapter = ServiceAdapterFactory.create_notification_adapter(adapter_type)
-    return _notification_adapter
+    adapter = _notification_adapters.get(adapter_type)
+    if adapter is None:
+        adapter = _notification_adapters[adapter_type] = ServiceAdapterFactory.create_notification_adapter(adapter_type)
+    return adapter
 
 
 def get_payment_adapter(adapter_type: str = "mock") -> PaymentServiceAdapter:
     """Get singleton payment adapter instance."""
-    global _payment_adapter
-    if _payment_adapter is None:
-        _payment_adapter = ServiceAdapterFactory.create_payment_adapter(adapter_type)
-    return _payment_adapter
+    adapter = _payment_adapters.get(adapter_type)
+    if adapter is None:
+        adapter = _payment_adapters[adapter_type] = ServiceAdapterFactory.create_payment_adapter(adapter_type)
+    return adapter
+
+
+def reset_service_adapters() -> None:
+    """Drop the singleton adapters (useful for testing)."""
+    _email_adapters.clear()
+    _notification_adapters.clear()
+    _payment_adapters.clear()
 
 
 # Configuration utilities
@@ -6,8 +6,11 @@ defined in the domain layer, following the Repository pattern.
 For MVP scope, using in-memory storage with thread-safe operations.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from threading import Lock
 import uuid
 
@@ -29,18 +32,22 @@ class InMemoryCustomerRepository(CustomerRepository):
     
     def __init__(self):
         self._customers: Dict[str, Customer] = {}
+        # Customer ids per email address in save order, so email lookups skip the scan
+        self._ids_by_email: Dict[str, Dict[str, None]] = {}
         self._lock = Lock()
     
     async def find_by_id(self, customer_id: CustomerId) -> Optional[Customer]:
         """Find customer by ID."""
-        with self._lock:
-            return self._customers.get(customer_id.value)
+        # A single dict lookup is atomic, so point reads skip the lock
+        return self._customers.get(customer_id.value)
     
     async def find_by_email(self, email: str) -> Optional[Customer]:
         """Find customer by email address."""
         with self._lock:
-            for customer in self._customers.values():
-                if customer.email == email:
+            # Entries left behind by customers edited in place are skipped
+            for customer_id in self._ids_by_email.get(email, ()):
+                customer = self._customers.get(customer_id)
+                if customer is not None and customer.email == email:
                     return customer
             return None
     
@@ -61,13 +68,28 @@ class InMemoryCustomerRepository(CustomerRepository):
     
     async def save(self, customer: Customer) -> None:
         """Save customer to repository."""
+        key = customer.customer_id.value
         with self._lock:
-            self._customers[customer.customer_id.value] = customer
+            previous = self._customers.get(key)
+            if previous is not None and previous.email != customer.email:
+                self._unindex_email(previous.email, key)
+            self._customers[key] = customer
+            self._ids_by_email.setdefault(customer.email, {})[key] = None
     
     async def delete(self, customer_id: CustomerId) -> None:
         """Delete customer from repository."""
         with self._lock:
-            self._customers.pop(customer_id.value, None)
+            customer = self._customers.pop(customer_id.value, None)
+            if customer is not None:
+                self._unindex_email(customer.email, customer_id.value)
+    
+    def _unindex_email(self, email: str, customer_id: str) -> None:
+        """Drop a customer id from the email index; caller holds the lock."""
+        customer_ids = self._ids_by_email.get(email)
+        if customer_ids is not None:
+            customer_ids.pop(customer_id, None)
+            if not customer_ids:
+                del self._ids_by_email[email]
 
 
 class InMemoryInvoiceRepository(InvoiceRepository):
@@ -75,12 +97,13 @@ class InMemoryInvoiceRepository(InvoiceRepository):
     
     def __init__(self):
         self._invoices: Dict[str, OverdueInvoice] = {}
+        # (due_date, invoice id) pairs kept sorted; due dates never change, unlike days_overdue
+        self._due_dates: List[Tuple[datetime, str]] = []
         self._lock = Lock()
     
     async def find_by_id(self, invoice_id: InvoiceId) -> Optional[OverdueInvoice]:
         """Find invoice by ID."""
-        with self._lock:
-            return self._invoices.get(invoice_id.value)
+        return self._invoices.get(invoice_id.value)
     
     async def find_by_customer_id(self, customer_id: CustomerId) -> List[OverdueInvoice]:
         """Find all overdue invoices for a customer."""
@@ -97,13 +120,17 @@ class InMemoryInvoiceRepository(InvoiceRepository):
     ) -> List[OverdueInvoice]:
         """Find overdue invoices with optional filters."""
         with self._lock:
-            invoices = list(self._invoices.values())
-            
-            if days_overdue is not None:
+            if days_overdue is not None and days_overdue > 0:
+                # Only invoices due at least that many days ago can qualify; the
+                # status-dependent days_overdue check then runs on those alone
+                cutoff = datetime.utcnow() - timedelta(days=days_overdue)
+                end = bisect_right(self._due_dates, cutoff, key=itemgetter(0))
                 invoices = [
-                    inv for inv in invoices 
+                    inv for inv in (self._invoices[key] for _, key in self._due_dates[:end])
                     if inv.days_overdue >= days_overdue
                 ]
+            else:
+                invoices = list(self._invoices.values())
             
             if min_amount is not None:
                 invoices = [
@@ -124,12 +151,23 @@ class InMemoryInvoiceRepository(InvoiceRepository):
     async def save(self, invoice: OverdueInvoice) -> None:
         """Save invoice to repository."""
         with self._lock:
-            self._invoices[invoice.invoice_id.value] = invoice
+            self._store(invoice)
     
     async def delete(self, invoice_id: InvoiceId) -> None:
         """Delete invoice from repository."""
         with self._lock:
-            self._invoices.pop(invoice_id.value, None)
+            invoice = self._invoices.pop(invoice_id.value, None)
+            if invoice is not None:
+                del self._due_dates[bisect_left(self._due_dates, (invoice.due_date, invoice_id.value))]
+    
+    def _store(self, invoice: OverdueInvoice) -> None:
+        """Store an invoice and keep the due date index in step; caller holds the lock."""
+        key = invoice.invoice_id.value
+        previous = self._invoices.get(key)
+        if previous is not None:
+            del self._due_dates[bisect_left(self._due_dates, (previous.due_date, key))]
+        self._invoices[key] = invoice
+        insort(self._due_dates, (invoice.due_date, key))
     
     async def update_payment_status(self, invoice_id: InvoiceId, status: str) -> None:
         """Update payment status of an invoice."""
@@ -148,7 +186,7 @@ class InMemoryInvoiceRepository(InvoiceRepository):
                     payment_terms=invoice.payment_terms
                 )
                 # Note: In real implementation, would have status field
-                self._invoices[invoice_id.value] = updated_invoice
+                self._store(updated_invoice)
 
 
 class InMemoryPaymentCampaignRepository(PaymentCampaignRepository):
@@ -160,8 +198,7 @@ class InMemoryPaymentCampaignRepository(PaymentCampaignRepository):
     
     async def find_by_id(self, campaign_id: CampaignId) -> Optional[PaymentCampaign]:
         """Find campaign by ID."""
-        with self._lock:
-            return self._campaigns.get(campaign_id.value)
+        return self._campaigns.get(campaign_id.value)
     
     async def find_by_customer_id(self, customer_id: CustomerId) -> List[PaymentCampaign]:
         """Find all campaigns for a customer."""
@@ -215,8 +252,7 @@ class InMemoryConversationRepository(ConversationRepository):
     
     async def find_by_id(self, conversation_id: ConversationId) -> Optional[Conversation]:
         """Find conversation by ID."""
-        with self._lock:
-            return self._conversations.get(conversation_id.value)
+        return self._conversations.get(conversation_id.value)
     
     async def find_by_customer_id(self, customer_id: CustomerId) -> List[Conversation]:
         """Find all conversations for a customer."""
@@ -290,39 +326,25 @@ class RepositoryFactory:
 
 
 # Singleton instances for MVP (in production, use proper DI container)
-_customer_repo = None
-_invoice_repo = None
-_campaign_repo = None
-_conversation_repo = None
-
-
+@lru_cache(maxsize=None)
 def get_customer_repository() -> CustomerRepository:
     """Get singleton customer repository instance."""
-    global _customer_repo
-    if _customer_repo is None:
-        _customer_repo = RepositoryFactory.create_customer_repository()
-    return _customer_repo
+    return RepositoryFactory.create_customer_repository()
 
 
+@lru_cache(maxsize=None)
 def get_invoice_repository() -> InvoiceRepository:
     """Get singleton invoice repository instance."""
-    global _invoice_repo
-    if _invoice_repo is None:
-        _invoice_repo = RepositoryFactory.create_invoice_repository()
-    return _invoice_repo
+    return RepositoryFactory.create_invoice_repository()
 
 
+@lru_cache(maxsize=None)
 def get_payment_campaign_repository() -> PaymentCampaignRepository:
     """Get singleton payment campaign repository instance."""
-    global _campaign_repo
-    if _campaign_repo is None:
-        _campaign_repo = RepositoryFactory.create_payment_campaign_repository()
-    return _campaign_repo
+    return RepositoryFactory.create_payment_campaign_repository()
 
 
+@lru_cache(maxsize=None)
 def get_conversation_repository() -> ConversationRepository:
     """Get singleton conversation repository instance."""
-    global _conversation_repo
-    if _conversation_repo is None:
-        _conversation_repo = RepositoryFactory.create_conversation_repository()
-    return _conversation_repo
\ No newline at end of file
+    return RepositoryFactory.create_conversation_repository()
\ No newline at end of file